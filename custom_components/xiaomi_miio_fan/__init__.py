@@ -1 +1,28 @@
 """Xiaomi Mi Smart Fan platform."""
+
+import voluptuous as vol
+
+from .const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    DATA_KEY_HASS_CONFIG,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DOMAIN,
+)
+
+# Options shared by all fans
+DOMAIN_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_MAX_CONCURRENT_REQUESTS, default=DEFAULT_MAX_CONCURRENT_REQUESTS
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema({vol.Optional(DOMAIN): DOMAIN_SCHEMA}, extra=vol.ALLOW_EXTRA)
+
+
+async def async_setup(hass, config):
+    """Set up the options shared by all fans and keep the configuration."""
+    hass.data[DOMAIN] = config.get(DOMAIN) or DOMAIN_SCHEMA({})
+    hass.data[DATA_KEY_HASS_CONFIG] = config
+    return True
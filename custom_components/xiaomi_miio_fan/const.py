@@ -0,0 +1,84 @@
+"""Constants of the Xiaomi Mi Smart Pedestal Fan platform."""
+
+DEFAULT_NAME = "Xiaomi Miio Fan"
+DEFAULT_RETRIES = 20
+DEFAULT_MAX_CONCURRENT_REQUESTS = 10
+DEFAULT_STATUS_CACHE_TTL = 0.5
+DOMAIN = "xiaomi_miio_fan"
+DATA_KEY = "fan.xiaomi_miio_fan"
+# Configuration of Home Assistant, passed to the platforms loaded by the fans
+DATA_KEY_HASS_CONFIG = "fan.xiaomi_miio_fan.hass_config"
+# Signal sent after each poll of the fan at the given host
+SIGNAL_POLLED = f"{DOMAIN}_polled_{{}}"
+
+CONF_MODEL = "model"
+CONF_RETRIES = "retries"
+CONF_PRESET_MODES_OVERRIDE = "preset_modes_override"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_DIAGNOSTIC_SENSORS = "diagnostic_sensors"
+CONF_ENVIRONMENT_SENSORS = "environment_sensors"
+CONF_STATUS_CACHE_TTL = "status_cache_ttl"
+CONF_HEDGE_REQUESTS = "hedge_requests"
+CONF_ATTRIBUTE_FILTERS = "attribute_filters"
+CONF_DEADBAND = "deadband"
+CONF_RELATIVE_DEADBAND = "relative_deadband"
+CONF_MIN_INTERVAL = "min_interval"
+
+MODEL_FAN_V2 = "zhimi.fan.v2"  # Pedestal Fan Fan V2
+MODEL_FAN_V3 = "zhimi.fan.v3"  # Pedestal Fan Fan V3
+MODEL_FAN_SA1 = "zhimi.fan.sa1"  # Pedestal Fan Fan SA1
+MODEL_FAN_ZA1 = "zhimi.fan.za1"  # Pedestal Fan Fan ZA1
+MODEL_FAN_ZA3 = "zhimi.fan.za3"  # Pedestal Fan Fan ZA3
+MODEL_FAN_ZA4 = "zhimi.fan.za4"  # Pedestal Fan Fan ZA4
+MODEL_FAN_ZA5 = "zhimi.fan.za5"  # Smartmi Standing Fan 3
+MODEL_FAN_P5 = "dmaker.fan.p5"  # Pedestal Fan Fan P5
+MODEL_FAN_P8 = "dmaker.fan.p8"  # Pedestal Fan Fan P8
+MODEL_FAN_P9 = "dmaker.fan.p9"  # Pedestal Fan Fan P9
+MODEL_FAN_P10 = "dmaker.fan.p10"  # Pedestal Fan Fan P10
+MODEL_FAN_P11 = "dmaker.fan.p11"  # Mijia Pedestal Fan
+MODEL_FAN_P15 = "dmaker.fan.p15"  # Pedestal Fan Fan P15
+MODEL_FAN_P18 = "dmaker.fan.p18"  # Mi Smart Standing Fan 2 P18
+MODEL_FAN_P30 = "dmaker.fan.p30"  # Mi Smart Standing Fan 2 P30
+MODEL_FAN_P33 = "dmaker.fan.p33"  # Mi Smart Standing Fan Pro 2
+MODEL_FAN_P39 = "dmaker.fan.p39"  # Smart Tower Fan
+MODEL_FAN_P45 = "xiaomi.fan.p45"  # Xiaomi Smart Tower Fan 2 (BHR8846EU)
+MODEL_FAN_XIAOMI_P30 = "xiaomi.fan.p30"  # Mi/Xiaomi Smart Standing Fan 2 P30
+MODEL_FAN_P76 = "xiaomi.fan.p76"  # Xiaomi Smart Standing Air Circulation Fan
+MODEL_FAN_P70 = "xiaomi.fan.p70"  # Smart Desktop Air Circulation Fan
+MODEL_FAN_P85 = "xiaomi.fan.p85"  # Xiaomi Smart Standing Fan Pro Slim
+MODEL_FAN_2LITE = "xiaomi.fan.2lite"  # Mi Smart Standing Fan 2 Lite
+MODEL_FAN_LESHOW_SS4 = "leshow.fan.ss4"
+MODEL_FAN_1C = "dmaker.fan.1c"  # Pedestal Fan Fan 1C
+
+# Models reporting the temperature and the humidity
+ENVIRONMENT_SENSOR_MODELS = [MODEL_FAN_V2, MODEL_FAN_V3, MODEL_FAN_ZA5]
+
+# Models accepted by the configuration schema. They must be the models of
+# FAN_MODELS in miio_fan.py, which scripts/check_platform.py checks.
+MODELS = [
+    MODEL_FAN_V2,
+    MODEL_FAN_V3,
+    MODEL_FAN_SA1,
+    MODEL_FAN_ZA1,
+    MODEL_FAN_ZA3,
+    MODEL_FAN_ZA4,
+    MODEL_FAN_ZA5,
+    MODEL_FAN_P5,
+    MODEL_FAN_P8,
+    MODEL_FAN_P9,
+    MODEL_FAN_P10,
+    MODEL_FAN_P11,
+    MODEL_FAN_P15,
+    MODEL_FAN_P18,
+    MODEL_FAN_P30,
+    MODEL_FAN_P33,
+    MODEL_FAN_P39,
+    MODEL_FAN_P45,
+    MODEL_FAN_XIAOMI_P30,
+    MODEL_FAN_P76,
+    MODEL_FAN_P70,
+    MODEL_FAN_P85,
+    MODEL_FAN_2LITE,
+    MODEL_FAN_LESHOW_SS4,
+    MODEL_FAN_1C,
+]
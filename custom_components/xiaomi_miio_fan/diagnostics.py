@@ -0,0 +1,71 @@
+"""Diagnostics of the Xiaomi Mi Smart Pedestal Fan platform.
+
+The fans are configured in YAML, so there are no config entries to attach
+the diagnostics platform of Home Assistant to. The diagnostics of the fans
+are returned by the ``fan_get_diagnostics`` service instead.
+"""
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST, CONF_TOKEN
+from homeassistant.core import callback
+
+if TYPE_CHECKING:
+    from .miio_fan import XiaomiGenericDevice
+
+TO_REDACT = {CONF_TOKEN}
+
+
+@callback
+def async_get_fan_diagnostics(
+    entity: "XiaomiGenericDevice", device_info: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Return the diagnostics of a fan."""
+    # Home Assistant imports the diagnostics module of every integration on
+    # startup, so python-miio is only imported once a fan asks for it
+    from miio.miot_device import MiotDevice  # noqa: PLC0415
+
+    from .miio_fan import _FanStatusMiot, async_get_request_limiter  # noqa: PLC0415
+
+    device = entity.device
+    stats = entity.request_stats
+    last_status = entity.last_status
+    limiter = async_get_request_limiter(entity.hass)
+    return async_redact_data(
+        {
+            "config": {
+                CONF_HOST: device.ip,
+                CONF_TOKEN: device.token,
+            },
+            "model": stats.model,
+            "device_info": device_info,
+            "mapping": (
+                device._get_mapping() if isinstance(device, MiotDevice) else None
+            ),
+            "last_status": (
+                last_status.as_dict()
+                if isinstance(last_status, _FanStatusMiot)
+                else getattr(last_status, "data", None)
+            ),
+            "handshake_age": (
+                time.monotonic() - stats.last_handshake
+                if stats.last_handshake is not None
+                else None
+            ),
+            "poll_interval": entity.platform.scan_interval.total_seconds(),
+            "availability": {
+                "available": entity.available,
+                "failed_polls": entity.failed_polls,
+                "retries": entity.retries,
+            },
+            "requests": stats.as_dict(),
+            "hedged_requests": getattr(device._protocol, "hedged", None),
+            "request_limiter": {
+                "limit": limiter.limit,
+                "queue_depth": limiter.queue_depth,
+            },
+        },
+        TO_REDACT,
+    )
@@ -0,0 +1,51 @@
+"""State attribute filters of the Xiaomi Mi Smart Pedestal Fan platform."""
+
+from dataclasses import dataclass
+import time
+from typing import Any
+
+
+@dataclass(slots=True)
+class AttributeFilter:
+    """Deadband and rate limit of a numeric state attribute.
+
+    A new value is published if it differs from the published one by more
+    than the deadband, which is the larger of the absolute deadband and the
+    relative deadband times the published value. Changes are published at
+    most once per minimum interval. Values which aren't numbers are always
+    published.
+    """
+
+    deadband: float = 0.0
+    # Fraction of the published value
+    relative_deadband: float = 0.0
+    # Minimum time between two published changes, in seconds
+    min_interval: float = 0.0
+    value: Any = None
+    published_at: float | None = None
+
+    def filter(self, value: Any) -> Any:
+        """Return the value to publish for a reported value."""
+        if value == self.value:
+            return self.value
+
+        now = time.monotonic()
+        if _is_number(value) and _is_number(self.value):
+            band = max(self.deadband, self.relative_deadband * abs(self.value))
+            if abs(value - self.value) <= band:
+                return self.value
+
+            if (
+                self.published_at is not None
+                and now - self.published_at < self.min_interval
+            ):
+                return self.value
+
+        self.value = value
+        self.published_at = now
+        return value
+
+
+def _is_number(value: Any) -> bool:
+    """Return true if the value is an int or a float but no bool."""
+    return isinstance(value, int | float) and not isinstance(value, bool)
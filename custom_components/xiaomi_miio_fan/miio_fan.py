@@ -0,0 +1,5352 @@
+"""Fans of the Xiaomi Mi Smart Pedestal Fan platform backed by python-miio.
+
+Importing python-miio loads all of its integrations, so this module is only
+imported by the fan platform once a fan is set up.
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from enum import Enum
+from functools import cached_property, partial
+import logging
+import math
+import random
+import time
+from typing import Any, Self
+import zlib
+
+from homeassistant.components.fan import (
+    ATTR_OSCILLATING,
+    ATTR_PERCENTAGE,
+    ATTR_PRESET_MODE,
+    FanEntity,
+    FanEntityFeature,
+)
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_MODE,
+    CONF_HOST,
+    CONF_NAME,
+    CONF_TOKEN,
+    STATE_OFF,
+    STATE_ON,
+    Platform,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    ServiceCall,
+    ServiceResponse,
+    State,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import PlatformNotReady
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+from homeassistant.util.percentage import (
+    ordered_list_item_to_percentage,
+    percentage_to_ordered_list_item,
+    percentage_to_ranged_value,
+    ranged_value_to_percentage,
+)
+from miio import Device, DeviceException, Fan, Fan1C, FanLeshow, FanMiot, FanP5
+from miio.fan_common import FanException
+from miio.fan_common import LedBrightness as FanLedBrightness
+from miio.fan_common import MoveDirection as FanMoveDirection
+from miio.fan_common import OperationMode as FanOperationMode
+from miio.integrations.fan.leshow.fan_leshow import (
+    OperationMode as FanLeshowOperationMode,
+)
+from miio.miot_device import DeviceStatus, MiotDevice
+import voluptuous as vol
+
+from .const import (
+    CONF_ATTRIBUTE_FILTERS,
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_ENVIRONMENT_SENSORS,
+    CONF_HEDGE_REQUESTS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MODEL,
+    CONF_PRESET_MODES_OVERRIDE,
+    CONF_RETRIES,
+    CONF_STATUS_CACHE_TTL,
+    DATA_KEY,
+    DATA_KEY_HASS_CONFIG,
+    DOMAIN,
+    ENVIRONMENT_SENSOR_MODELS,
+    MODEL_FAN_1C,
+    MODEL_FAN_2LITE,
+    MODEL_FAN_LESHOW_SS4,
+    MODEL_FAN_P5,
+    MODEL_FAN_P8,
+    MODEL_FAN_P9,
+    MODEL_FAN_P10,
+    MODEL_FAN_P11,
+    MODEL_FAN_P15,
+    MODEL_FAN_P18,
+    MODEL_FAN_P30,
+    MODEL_FAN_P33,
+    MODEL_FAN_P39,
+    MODEL_FAN_P45,
+    MODEL_FAN_P70,
+    MODEL_FAN_P76,
+    MODEL_FAN_P85,
+    MODEL_FAN_SA1,
+    MODEL_FAN_V2,
+    MODEL_FAN_V3,
+    MODEL_FAN_XIAOMI_P30,
+    MODEL_FAN_ZA1,
+    MODEL_FAN_ZA3,
+    MODEL_FAN_ZA4,
+    MODEL_FAN_ZA5,
+    SIGNAL_POLLED,
+)
+from .diagnostics import async_get_fan_diagnostics
+from .filters import AttributeFilter
+from .protocol import HedgedMiIOProtocol
+from .stats import RequestStats, error_code
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_KEY_DEVICE_INFO = "fan.xiaomi_miio_fan.device_info"
+STORAGE_KEY_DEVICE_INFO = f"{DOMAIN}.device_info"
+STORAGE_VERSION = 1
+DEVICE_INFO_REVALIDATE_INTERVAL = timedelta(days=1)
+DEVICE_INFO_SAVE_DELAY = 10
+DATA_KEY_POLL_SCHEDULER = "fan.xiaomi_miio_fan.poll_scheduler"
+# Upper bound of the random delay of the first poll of a fan, in seconds
+FIRST_REFRESH_JITTER = 10
+FIRST_REFRESH_CONCURRENCY = 4
+# Cooldown between the refreshes requested by commands, in seconds. The first
+# refresh runs right away, further ones of a burst once at the end.
+COMMAND_REFRESH_COOLDOWN = 1.0
+# Angle of a single turn action, in degrees
+TURN_STEP_ANGLE = 7.5
+TURN_MAX_STEPS = 48
+# Pause between the turn actions of a multi-step turn, in seconds
+TURN_STEP_INTERVAL = 0.1
+DATA_KEY_REQUEST_LIMITER = "fan.xiaomi_miio_fan.request_limiter"
+# Drift of the delay off deadline tolerated before it is moved. The countdown
+# of most models is reported in whole minutes.
+DELAY_OFF_DEADLINE_TOLERANCE = timedelta(seconds=90)
+# Interval of updating the countdown of a running delay off timer
+DELAY_OFF_RESYNC_INTERVAL = timedelta(minutes=15)
+
+
+@dataclass(frozen=True)
+class FanModel:
+    """Description of a supported fan model."""
+
+    device: "type[Device] | MiotFanSpec"
+    entity_class: type["XiaomiGenericDevice"]
+    features: int
+    attributes: dict[str, str]
+    # Model of the python-miio mapping, if it differs from the device model
+    mapping_model: str | None = None
+    # Seconds per unit of the reported delay off countdown
+    delay_off_unit: int = 60
+    # Status field of the remaining delay off time, in delay_off_unit, if the
+    # countdown attribute reports the configured length of the timer instead
+    delay_off_remaining: str | None = None
+    # Status field of the switch enabling the delay off timer, if any
+    delay_off_switch: str | None = None
+    # Whether the remaining delay off time is reported at all, so a deadline
+    # can be derived from it
+    delay_off_deadline: bool = True
+
+    @property
+    def device_class(self) -> type[Device]:
+        """Return the python-miio device class of the model."""
+        if isinstance(self.device, MiotFanSpec):
+            return self.device.device_class
+        return self.device
+
+
+# Registry of the supported models, filled at the end of the module
+FAN_MODELS: dict[str, FanModel] = {}
+
+SPEED_OFF = "off"
+
+ATTR_MODEL = "model"
+ATTR_MAC_ADDRESS = "mac_address"
+ATTR_FIRMWARE_VERSION = "firmware_version"
+ATTR_HARDWARE_VERSION = "hardware_version"
+ATTR_DETECTED_AT = "detected_at"
+ATTR_BRIGHTNESS = "brightness"
+ATTR_DIRECTION = "direction"
+ATTR_STEPS = "steps"
+
+ATTR_TEMPERATURE = "temperature"
+ATTR_HUMIDITY = "humidity"
+ATTR_LED = "led"
+ATTR_LED_BRIGHTNESS = "led_brightness"
+ATTR_RAW_LED_BRIGHTNESS = "raw_led_brightness"
+ATTR_BUZZER = "buzzer"
+ATTR_CHILD_LOCK = "child_lock"
+ATTR_NATURAL_SPEED = "natural_speed"
+ATTR_OSCILLATE = "oscillate"
+ATTR_BATTERY = "battery"
+ATTR_BATTERY_CHARGE = "battery_charge"
+ATTR_BATTERY_STATE = "battery_state"
+ATTR_AC_POWER = "ac_power"
+ATTR_DELAY_OFF_COUNTDOWN = "delay_off_countdown"
+ATTR_DELAY_OFF_DEADLINE = "delay_off_deadline"
+ATTR_STALE = "stale"
+ATTR_ANGLE = "angle"
+ATTR_DIRECT_SPEED = "direct_speed"
+ATTR_USE_TIME = "use_time"
+ATTR_BUTTON_PRESSED = "button_pressed"
+ATTR_RAW_SPEED = "raw_speed"
+ATTR_IONIZER = "anion"
+ATTR_VERTICAL_OSCILLATE = "vertical_oscillate"
+ATTR_VERTICAL_ANGLE = "vertical_angle"
+
+# Fan Leshow SS4
+ATTR_ERROR_DETECTED = "error_detected"
+
+AVAILABLE_ATTRIBUTES_FAN = {
+    ATTR_ANGLE: "angle",
+    ATTR_RAW_SPEED: "speed",
+    ATTR_DELAY_OFF_COUNTDOWN: "delay_off_countdown",
+    ATTR_AC_POWER: "ac_power",
+    ATTR_OSCILLATE: "oscillate",
+    ATTR_DIRECT_SPEED: "direct_speed",
+    ATTR_NATURAL_SPEED: "natural_speed",
+    ATTR_CHILD_LOCK: "child_lock",
+    ATTR_BUZZER: "buzzer",
+    ATTR_LED_BRIGHTNESS: "led_brightness",
+    ATTR_USE_TIME: "use_time",
+    # Additional properties of version 2 and 3
+    ATTR_TEMPERATURE: "temperature",
+    ATTR_HUMIDITY: "humidity",
+    ATTR_BATTERY: "battery",
+    ATTR_BATTERY_CHARGE: "battery_charge",
+    ATTR_BUTTON_PRESSED: "button_pressed",
+    # Additional properties of version 2
+    ATTR_LED: "led",
+    ATTR_BATTERY_STATE: "battery_state",
+}
+
+AVAILABLE_ATTRIBUTES_FAN_P5 = {
+    ATTR_MODE: "mode",
+    ATTR_OSCILLATE: "oscillate",
+    ATTR_ANGLE: "angle",
+    ATTR_DELAY_OFF_COUNTDOWN: "delay_off_countdown",
+    ATTR_LED: "led",
+    ATTR_BUZZER: "buzzer",
+    ATTR_CHILD_LOCK: "child_lock",
+    ATTR_RAW_SPEED: "speed",
+}
+
+
+AVAILABLE_ATTRIBUTES_FAN_P33 = {
+    ATTR_MODE: "mode",
+    ATTR_OSCILLATE: "oscillate",
+    ATTR_ANGLE: "angle",
+    ATTR_DELAY_OFF_COUNTDOWN: "delay_off_countdown",
+    ATTR_LED: "led",
+    ATTR_BUZZER: "buzzer",
+    ATTR_CHILD_LOCK: "child_lock",
+    ATTR_RAW_SPEED: "speed",
+}
+
+AVAILABLE_ATTRIBUTES_FAN_P39 = {
+    ATTR_MODE: "mode",
+    ATTR_OSCILLATE: "oscillate",
+    ATTR_ANGLE: "angle",
+    ATTR_DELAY_OFF_COUNTDOWN: "delay_off_countdown",
+    ATTR_CHILD_LOCK: "child_lock",
+    ATTR_RAW_SPEED: "speed",
+}
+
+AVAILABLE_ATTRIBUTES_FAN_P45 = {
+    ATTR_MODE: "mode",
+    ATTR_OSCILLATE: "horizontal_swing",
+    ATTR_ANGLE: "horizontal_swing_angle",
+    ATTR_DELAY_OFF_COUNTDOWN: "delay_time",
+    ATTR_LED: "led",
+    ATTR_BUZZER: "buzzer",
+    ATTR_CHILD_LOCK: "child_lock",
+    ATTR_RAW_SPEED: "fan_speed",
+}
+
+AVAILABLE_ATTRIBUTES_FAN_XIAOMI_P30 = {
+    ATTR_MODE: "mode",
+    ATTR_OSCILLATE: "horizontal_swing",
+    ATTR_ANGLE: "horizontal_swing_angle",
+    ATTR_DELAY_OFF_COUNTDOWN: "delay_time",
+    ATTR_LED: "led",
+    ATTR_BUZZER: "buzzer",
+    ATTR_CHILD_LOCK: "child_lock",
+    ATTR_RAW_SPEED: "fan_speed",
+}
+
+AVAILABLE_ATTRIBUTES_FAN_P76 = {
+    ATTR_MODE: "mode",
+    ATTR_OSCILLATE: "horizontal_swing",
+    ATTR_ANGLE: "horizontal_swing_angle",
+    ATTR_VERTICAL_OSCILLATE: "vertical_swing",
+    ATTR_VERTICAL_ANGLE: "vertical_swing_angle",
+    ATTR_DELAY_OFF_COUNTDOWN: "delay_time",
+    ATTR_LED: "led",
+    ATTR_BUZZER: "buzzer",
+    ATTR_CHILD_LOCK: "child_lock",
+    ATTR_RAW_SPEED: "fan_speed",
+}
+
+AVAILABLE_ATTRIBUTES_FAN_P70 = {
+    ATTR_MODE: "mode",
+    ATTR_OSCILLATE: "horizontal_swing",
+    ATTR_ANGLE: "horizontal_swing_angle",
+    ATTR_VERTICAL_OSCILLATE: "vertical_swing",
+    ATTR_VERTICAL_ANGLE: "vertical_swing_angle",
+    ATTR_DELAY_OFF_COUNTDOWN: "delay_time",
+    ATTR_LED: "led",
+    ATTR_BUZZER: "buzzer",
+    ATTR_CHILD_LOCK: "child_lock",
+    ATTR_RAW_SPEED: "fan_speed",
+}
+
+AVAILABLE_ATTRIBUTES_FAN_2LITE = {
+    ATTR_MODE: "mode",
+    ATTR_OSCILLATE: "horizontal_swing",
+    ATTR_DELAY_OFF_COUNTDOWN: "delay_time",
+    ATTR_LED: "led",
+    ATTR_BUZZER: "buzzer",
+    ATTR_CHILD_LOCK: "child_lock",
+}
+
+AVAILABLE_ATTRIBUTES_FAN_P85 = {
+    ATTR_MODE: "mode",
+    ATTR_OSCILLATE: "horizontal_swing",
+    ATTR_ANGLE: "horizontal_swing_angle",
+    ATTR_DELAY_OFF_COUNTDOWN: "delay_time",
+    ATTR_LED: "led",
+    ATTR_BUZZER: "buzzer",
+    ATTR_CHILD_LOCK: "child_lock",
+    ATTR_RAW_SPEED: "fan_speed",
+}
+
+AVAILABLE_ATTRIBUTES_FAN_LESHOW_SS4 = {
+    ATTR_MODE: "mode",
+    ATTR_RAW_SPEED: "speed",
+    ATTR_BUZZER: "buzzer",
+    ATTR_OSCILLATE: "oscillate",
+    ATTR_DELAY_OFF_COUNTDOWN: "delay_off_countdown",
+    ATTR_ERROR_DETECTED: "error_detected",
+}
+
+AVAILABLE_ATTRIBUTES_FAN_1C = {
+    ATTR_MODE: "mode",
+    ATTR_RAW_SPEED: "speed",
+    ATTR_BUZZER: "buzzer",
+    ATTR_OSCILLATE: "oscillate",
+    ATTR_DELAY_OFF_COUNTDOWN: "delay_off_countdown",
+    ATTR_LED: "led",
+    ATTR_CHILD_LOCK: "child_lock",
+}
+
+AVAILABLE_ATTRIBUTES_FAN_ZA5 = {
+    ATTR_ANGLE: "swing_mode_angle",
+    ATTR_DIRECT_SPEED: "fan_speed",
+    ATTR_NATURAL_SPEED: "fan_speed",
+    ATTR_DELAY_OFF_COUNTDOWN: "power_off_time",
+    ATTR_AC_POWER: "powersupply_attached",
+    ATTR_OSCILLATE: "swing_mode",
+    ATTR_MODE: "mode",
+    ATTR_CHILD_LOCK: "child_lock",
+    ATTR_BUZZER: "buzzer",
+    ATTR_RAW_LED_BRIGHTNESS: "light",
+    ATTR_LED_BRIGHTNESS: "light_enum",
+    ATTR_TEMPERATURE: "temperature",
+    ATTR_HUMIDITY: "humidity",
+    ATTR_BUTTON_PRESSED: "buttons_pressed",
+    # Fixed attributes
+    ATTR_LED: "led",
+    ATTR_RAW_SPEED: "speed_rpm",
+    ATTR_BATTERY: "battery_supported",
+    ATTR_BATTERY_STATE: "battery_state",
+    ATTR_IONIZER: "anion",
+}
+
+FAN_SPEED_LEVEL1 = "Level 1"
+FAN_SPEED_LEVEL2 = "Level 2"
+FAN_SPEED_LEVEL3 = "Level 3"
+FAN_SPEED_LEVEL4 = "Level 4"
+
+FAN_SPEED_NATURAL1 = "Natural 1"
+FAN_SPEED_NATURAL2 = "Natural 2"
+FAN_SPEED_NATURAL3 = "Natural 3"
+FAN_SPEED_NATURAL4 = "Natural 4"
+
+FAN_PRESET_MODES = {
+    SPEED_OFF: range(0, 1),
+    FAN_SPEED_LEVEL1: range(1, 26),
+    FAN_SPEED_LEVEL2: range(26, 51),
+    FAN_SPEED_LEVEL3: range(51, 76),
+    FAN_SPEED_LEVEL4: range(76, 101),
+}
+
+FAN_PRESET_MODE_VALUES = {
+    SPEED_OFF: 0,
+    FAN_SPEED_LEVEL1: 1,
+    FAN_SPEED_LEVEL2: 35,
+    FAN_SPEED_LEVEL3: 74,
+    FAN_SPEED_LEVEL4: 100,
+}
+
+FAN_PRESET_MODE_VALUES_P5 = {
+    SPEED_OFF: 0,
+    FAN_SPEED_LEVEL1: 1,
+    FAN_SPEED_LEVEL2: 35,
+    FAN_SPEED_LEVEL3: 70,
+    FAN_SPEED_LEVEL4: 100,
+}
+
+FAN_PRESET_MODES_1C = {
+    SPEED_OFF: 0,
+    FAN_SPEED_LEVEL1: 1,
+    FAN_SPEED_LEVEL2: 2,
+    FAN_SPEED_LEVEL3: 3,
+}
+
+FAN_PRESET_MODES_ZA5 = {
+    SPEED_OFF: 0,
+    FAN_SPEED_LEVEL1: 25,
+    FAN_SPEED_LEVEL2: 50,
+    FAN_SPEED_LEVEL3: 75,
+    FAN_SPEED_LEVEL4: 100,
+}
+
+FAN_PRESET_MODES_P33 = {
+    SPEED_OFF: 0,
+    FAN_SPEED_LEVEL1: 1,
+    FAN_SPEED_LEVEL2: 35,
+    FAN_SPEED_LEVEL3: 70,
+    FAN_SPEED_LEVEL4: 100,
+}
+
+FAN_PRESET_MODES_P39 = {
+    SPEED_OFF: 0,
+    FAN_SPEED_LEVEL1: 1,
+    FAN_SPEED_LEVEL2: 35,
+    FAN_SPEED_LEVEL3: 70,
+    FAN_SPEED_LEVEL4: 100,
+}
+
+FAN_SPEEDS_1C = list(FAN_PRESET_MODES_1C)
+FAN_SPEEDS_1C.remove(SPEED_OFF)
+
+# FIXME: Add speed level 4
+FAN_SPEEDS_ZA5 = list(FAN_PRESET_MODES_ZA5)
+FAN_SPEEDS_ZA5.remove(SPEED_OFF)
+
+FAN_SPEEDS_P33 = list(FAN_PRESET_MODES_P33)
+FAN_SPEEDS_P33.remove(SPEED_OFF)
+
+FAN_SPEEDS_P39 = list(FAN_PRESET_MODES_P39)
+FAN_SPEEDS_P39.remove(SPEED_OFF)
+
+FAN_PRESET_MODES_P76 = {
+    SPEED_OFF: -1,
+    FAN_SPEED_LEVEL1: 0,
+    FAN_SPEED_LEVEL2: 1,
+    FAN_SPEED_LEVEL3: 2,
+    FAN_SPEED_LEVEL4: 3,
+    FAN_SPEED_NATURAL1: 0,
+    FAN_SPEED_NATURAL2: 1,
+    FAN_SPEED_NATURAL3: 2,
+    FAN_SPEED_NATURAL4: 3,
+}
+
+FAN_SPEEDS_P76 = [
+    FAN_SPEED_LEVEL1,
+    FAN_SPEED_LEVEL2,
+    FAN_SPEED_LEVEL3,
+    FAN_SPEED_LEVEL4,
+    FAN_SPEED_NATURAL1,
+    FAN_SPEED_NATURAL2,
+    FAN_SPEED_NATURAL3,
+    FAN_SPEED_NATURAL4,
+]
+
+FAN_PRESET_MODES_XIAOMI_P30 = {
+    SPEED_OFF: -1,
+    FAN_SPEED_LEVEL1: 1,
+    FAN_SPEED_LEVEL2: 2,
+    FAN_SPEED_LEVEL3: 3,
+    FAN_SPEED_LEVEL4: 4,
+    FAN_SPEED_NATURAL1: 1,
+    FAN_SPEED_NATURAL2: 2,
+    FAN_SPEED_NATURAL3: 3,
+    FAN_SPEED_NATURAL4: 4,
+}
+
+FAN_PRESET_MODES_P70 = {
+    SPEED_OFF: -1,
+    FAN_SPEED_LEVEL1: 0,
+    FAN_SPEED_LEVEL2: 1,
+    FAN_SPEED_LEVEL3: 2,
+    FAN_SPEED_LEVEL4: 3,
+}
+
+FAN_SPEEDS_P70 = [
+    FAN_SPEED_LEVEL1,
+    FAN_SPEED_LEVEL2,
+    FAN_SPEED_LEVEL3,
+    FAN_SPEED_LEVEL4,
+]
+
+FAN_PRESET_MODES_P85 = {
+    SPEED_OFF: -1,
+    FAN_SPEED_LEVEL1: 1,
+    FAN_SPEED_LEVEL2: 2,
+    FAN_SPEED_LEVEL3: 3,
+    FAN_SPEED_LEVEL4: 4,
+    FAN_SPEED_NATURAL1: 1,
+    FAN_SPEED_NATURAL2: 2,
+    FAN_SPEED_NATURAL3: 3,
+    FAN_SPEED_NATURAL4: 4,
+}
+
+FAN_PRESET_MODE_SLEEP = "Sleep"
+
+# Smart Tower Fan 2 (xiaomi.fan.p45) — fan-level enum: Level1..Level4 (1..4).
+# Sleep is a standalone mode (no level selector) and is treated as a single
+# preset that maps to mode=Sleep.
+FAN_PRESET_MODES_P45 = {
+    SPEED_OFF: -1,
+    FAN_SPEED_LEVEL1: 1,
+    FAN_SPEED_LEVEL2: 2,
+    FAN_SPEED_LEVEL3: 3,
+    FAN_SPEED_LEVEL4: 4,
+    FAN_SPEED_NATURAL1: 1,
+    FAN_SPEED_NATURAL2: 2,
+    FAN_SPEED_NATURAL3: 3,
+    FAN_SPEED_NATURAL4: 4,
+    FAN_PRESET_MODE_SLEEP: 1,
+}
+
+FAN_SPEEDS_P45 = [
+    FAN_SPEED_LEVEL1,
+    FAN_SPEED_LEVEL2,
+    FAN_SPEED_LEVEL3,
+    FAN_SPEED_LEVEL4,
+    FAN_SPEED_NATURAL1,
+    FAN_SPEED_NATURAL2,
+    FAN_SPEED_NATURAL3,
+    FAN_SPEED_NATURAL4,
+    FAN_PRESET_MODE_SLEEP,
+]
+
+FAN_PRESET_MODES_2LITE = [FAN_PRESET_MODE_SLEEP]
+
+FAN_2LITE_SPEED_COUNT = 3
+
+SUCCESS = ["ok"]
+
+FEATURE_SET_BUZZER = 1
+FEATURE_SET_LED = 2
+FEATURE_SET_CHILD_LOCK = 4
+FEATURE_SET_LED_BRIGHTNESS = 8
+FEATURE_SET_OSCILLATION_ANGLE = 16
+FEATURE_SET_NATURAL_MODE = 32
+FEATURE_SET_ANION = 64
+FEATURE_SET_VERTICAL_OSCILLATION = 128
+FEATURE_TURN = 256
+FEATURE_SET_VERTICAL_OSCILLATION_ANGLE = 512
+
+FEATURE_FLAGS_FAN = (
+    FEATURE_SET_BUZZER
+    | FEATURE_SET_CHILD_LOCK
+    | FEATURE_SET_LED_BRIGHTNESS
+    | FEATURE_SET_OSCILLATION_ANGLE
+    | FEATURE_SET_NATURAL_MODE
+)
+
+FEATURE_FLAGS_FAN_P5 = (
+    FEATURE_SET_BUZZER
+    | FEATURE_SET_CHILD_LOCK
+    | FEATURE_SET_NATURAL_MODE
+    | FEATURE_SET_OSCILLATION_ANGLE
+    | FEATURE_SET_LED
+)
+
+FEATURE_FLAGS_FAN_LESHOW_SS4 = FEATURE_SET_BUZZER
+FEATURE_FLAGS_FAN_1C = (
+    FEATURE_SET_BUZZER
+    | FEATURE_SET_CHILD_LOCK
+    | FEATURE_SET_LED
+    | FEATURE_SET_OSCILLATION_ANGLE
+    | FEATURE_SET_NATURAL_MODE
+)
+
+FEATURE_FLAGS_FAN_ZA5 = (
+    FEATURE_SET_BUZZER
+    | FEATURE_SET_CHILD_LOCK
+    | FEATURE_SET_LED_BRIGHTNESS
+    | FEATURE_SET_OSCILLATION_ANGLE
+    | FEATURE_SET_NATURAL_MODE
+    | FEATURE_SET_ANION
+)
+
+FEATURE_FLAGS_FAN_P33 = (
+    FEATURE_SET_BUZZER
+    | FEATURE_SET_CHILD_LOCK
+    | FEATURE_SET_LED
+    | FEATURE_SET_OSCILLATION_ANGLE
+    | FEATURE_SET_NATURAL_MODE
+)
+
+FEATURE_FLAGS_FAN_P39 = (
+    FEATURE_SET_CHILD_LOCK | FEATURE_SET_OSCILLATION_ANGLE | FEATURE_SET_NATURAL_MODE
+)
+
+# Xiaomi Smart Tower Fan 2 (xiaomi.fan.p45). Canonical spec exposes
+# 30/60/90/120/150 swing angles and three modes (Straight / Natural / Sleep).
+FEATURE_FLAGS_FAN_P45 = (
+    FEATURE_SET_BUZZER
+    | FEATURE_SET_CHILD_LOCK
+    | FEATURE_SET_LED
+    | FEATURE_SET_OSCILLATION_ANGLE
+    | FEATURE_SET_NATURAL_MODE
+    | FEATURE_TURN
+)
+
+FEATURE_FLAGS_FAN_XIAOMI_P30 = (
+    FEATURE_SET_BUZZER
+    | FEATURE_SET_CHILD_LOCK
+    | FEATURE_SET_LED
+    | FEATURE_SET_OSCILLATION_ANGLE
+    | FEATURE_SET_NATURAL_MODE
+    | FEATURE_TURN
+)
+
+FEATURE_FLAGS_FAN_P76 = (
+    FEATURE_SET_BUZZER
+    | FEATURE_SET_CHILD_LOCK
+    | FEATURE_SET_LED
+    | FEATURE_SET_OSCILLATION_ANGLE
+    | FEATURE_SET_NATURAL_MODE
+    | FEATURE_SET_VERTICAL_OSCILLATION
+    | FEATURE_TURN
+    | FEATURE_SET_VERTICAL_OSCILLATION_ANGLE
+)
+
+FEATURE_FLAGS_FAN_P70 = (
+    FEATURE_SET_BUZZER
+    | FEATURE_SET_CHILD_LOCK
+    | FEATURE_SET_LED
+    | FEATURE_SET_OSCILLATION_ANGLE
+    | FEATURE_SET_NATURAL_MODE
+    | FEATURE_SET_VERTICAL_OSCILLATION
+    | FEATURE_TURN
+    | FEATURE_SET_VERTICAL_OSCILLATION_ANGLE
+)
+
+FEATURE_FLAGS_FAN_2LITE = (
+    FEATURE_SET_BUZZER
+    | FEATURE_SET_CHILD_LOCK
+    | FEATURE_SET_LED
+    | FEATURE_SET_NATURAL_MODE
+)
+
+FEATURE_FLAGS_FAN_P85 = (
+    FEATURE_SET_BUZZER
+    | FEATURE_SET_CHILD_LOCK
+    | FEATURE_SET_LED
+    | FEATURE_SET_OSCILLATION_ANGLE
+    | FEATURE_SET_NATURAL_MODE
+    | FEATURE_TURN
+)
+
+SERVICE_SET_BUZZER_ON = "fan_set_buzzer_on"
+SERVICE_SET_BUZZER_OFF = "fan_set_buzzer_off"
+SERVICE_SET_CHILD_LOCK_ON = "fan_set_child_lock_on"
+SERVICE_SET_CHILD_LOCK_OFF = "fan_set_child_lock_off"
+SERVICE_SET_LED_BRIGHTNESS = "fan_set_led_brightness"
+SERVICE_SET_RAW_LED_BRIGHTNESS = "fan_set_raw_led_brightness"
+SERVICE_SET_OSCILLATION_ANGLE = "fan_set_oscillation_angle"
+SERVICE_SET_DELAY_OFF = "fan_set_delay_off"
+SERVICE_SET_NATURAL_MODE_ON = "fan_set_natural_mode_on"
+SERVICE_SET_NATURAL_MODE_OFF = "fan_set_natural_mode_off"
+SERVICE_SET_ANION_ON = "fan_set_anion_on"
+SERVICE_SET_ANION_OFF = "fan_set_anion_off"
+SERVICE_SET_VERTICAL_OSCILLATION_ON = "fan_set_vertical_oscillation_on"
+SERVICE_SET_VERTICAL_OSCILLATION_OFF = "fan_set_vertical_oscillation_off"
+SERVICE_TURN = "fan_turn"
+SERVICE_SET_VERTICAL_OSCILLATION_ANGLE = "fan_set_vertical_oscillation_angle"
+SERVICE_GET_DIAGNOSTICS = "fan_get_diagnostics"
+
+AIRPURIFIER_SERVICE_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTITY_ID): cv.entity_ids})
+
+SERVICE_SCHEMA_LED_BRIGHTNESS = AIRPURIFIER_SERVICE_SCHEMA.extend(
+    {vol.Required(ATTR_BRIGHTNESS): vol.All(vol.Coerce(int), vol.Range(min=0, max=2))}
+)
+
+SERVICE_SCHEMA_RAW_LED_BRIGHTNESS = AIRPURIFIER_SERVICE_SCHEMA.extend(
+    {vol.Required(ATTR_BRIGHTNESS): vol.All(vol.Coerce(int), vol.Range(min=0, max=100))}
+)
+
+SERVICE_SCHEMA_OSCILLATION_ANGLE = AIRPURIFIER_SERVICE_SCHEMA.extend(
+    {vol.Required(ATTR_ANGLE): cv.positive_int}
+)
+
+SERVICE_SCHEMA_DELAY_OFF = AIRPURIFIER_SERVICE_SCHEMA.extend(
+    {
+        vol.Required(ATTR_DELAY_OFF_COUNTDOWN): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=600)
+        )
+    }
+)
+
+SERVICE_SCHEMA_TURN = AIRPURIFIER_SERVICE_SCHEMA.extend(
+    {
+        vol.Required(ATTR_DIRECTION): vol.All(
+            vol.Coerce(str), vol.In(["left", "right", "up", "down"])
+        ),
+        vol.Exclusive(ATTR_STEPS, "turn_amount"): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=TURN_MAX_STEPS)
+        ),
+        vol.Exclusive(ATTR_ANGLE, "turn_amount"): vol.All(
+            vol.Coerce(float),
+            vol.Range(min=TURN_STEP_ANGLE, max=TURN_STEP_ANGLE * TURN_MAX_STEPS),
+        ),
+    }
+)
+
+SERVICE_SCHEMA_VERTICAL_OSCILLATION_ANGLE = AIRPURIFIER_SERVICE_SCHEMA.extend(
+    {vol.Required(ATTR_VERTICAL_ANGLE): cv.positive_int}
+)
+
+SERVICE_TO_METHOD = {
+    SERVICE_SET_BUZZER_ON: {"method": "async_set_buzzer_on"},
+    SERVICE_SET_BUZZER_OFF: {"method": "async_set_buzzer_off"},
+    SERVICE_SET_CHILD_LOCK_ON: {"method": "async_set_child_lock_on"},
+    SERVICE_SET_CHILD_LOCK_OFF: {"method": "async_set_child_lock_off"},
+    SERVICE_SET_LED_BRIGHTNESS: {
+        "method": "async_set_led_brightness",
+        "schema": SERVICE_SCHEMA_LED_BRIGHTNESS,
+    },
+    SERVICE_SET_RAW_LED_BRIGHTNESS: {
+        "method": "async_set_raw_led_brightness",
+        "schema": SERVICE_SCHEMA_RAW_LED_BRIGHTNESS,
+    },
+    SERVICE_SET_OSCILLATION_ANGLE: {
+        "method": "async_set_oscillation_angle",
+        "schema": SERVICE_SCHEMA_OSCILLATION_ANGLE,
+    },
+    SERVICE_SET_DELAY_OFF: {
+        "method": "async_set_delay_off",
+        "schema": SERVICE_SCHEMA_DELAY_OFF,
+    },
+    SERVICE_SET_NATURAL_MODE_ON: {"method": "async_set_natural_mode_on"},
+    SERVICE_SET_NATURAL_MODE_OFF: {"method": "async_set_natural_mode_off"},
+    SERVICE_SET_ANION_ON: {"method": "async_set_anion_on"},
+    SERVICE_SET_ANION_OFF: {"method": "async_set_anion_off"},
+    SERVICE_SET_VERTICAL_OSCILLATION_ON: {
+        "method": "async_set_vertical_oscillation_on"
+    },
+    SERVICE_SET_VERTICAL_OSCILLATION_OFF: {
+        "method": "async_set_vertical_oscillation_off"
+    },
+    SERVICE_TURN: {
+        "method": "async_turn",
+        "schema": SERVICE_SCHEMA_TURN,
+    },
+    SERVICE_SET_VERTICAL_OSCILLATION_ANGLE: {
+        "method": "async_set_vertical_oscillation_angle",
+        "schema": SERVICE_SCHEMA_VERTICAL_OSCILLATION_ANGLE,
+    },
+}
+
+
+# backported from current master
+def _filter_request_fields(req):
+    """Return only the parts that belong to the request."""
+    return {k: v for k, v in req.items() if k in ["did", "siid", "piid"]}
+
+
+class _FanStatusMiot:
+    """Base class of the slotted status containers for MIoT fans.
+
+    The ``get_properties`` response is decoded once on construction: every
+    name in ``__slots__`` is read from the response (through ``_aliases``)
+    and enum-backed properties listed in ``_enums`` are stored by name. The
+    response itself isn't kept.
+
+    Unlike python-miio's ``DeviceStatus``, which has no ``__slots__``, the
+    containers have no instance ``__dict__``.
+    """
+
+    __slots__ = ()
+
+    _enums: dict[str, type[Enum]] = {}
+    _aliases: dict[str, str] = {}
+    _fields: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Collect the fields of the status container and its bases."""
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            if klass is not _FanStatusMiot
+            for name in klass.__dict__.get("__slots__", ())
+        )
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Initialize."""
+        self._decode(data, self._fields)
+
+    def _decode(self, data: dict[str, Any], names: Iterable[str]) -> None:
+        """Decode the given fields from the property values."""
+        for name in names:
+            value = data.get(self._aliases.get(name, name))
+            enum = self._enums.get(name)
+            if enum is not None and value is not None:
+                value = enum(value).name
+            setattr(self, name, value)
+
+    def _replace(self, data: dict[str, Any]) -> Self:
+        """Return a copy of the status with the given property values."""
+        status = object.__new__(type(self))
+        for name in self._fields:
+            setattr(status, name, getattr(self, name))
+        status._decode(
+            data,
+            [name for name in self._fields if self._aliases.get(name, name) in data],
+        )
+        return status
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the fields of the status container."""
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __repr__(self) -> str:
+        """Return all fields of the status container."""
+        fields = " ".join(f"{name}={getattr(self, name)}" for name in self._fields)
+        return f"<{self.__class__.__name__} {fields}>"
+
+
+class _MiotDevice(MiotDevice):
+    """Base class of the MIoT devices adding the written values to the results.
+
+    The ``set_properties`` response only carries a code per property. With the
+    value next to it, the entity can apply a successful write to the status
+    it knows instead of reading the status back.
+    """
+
+    def set_property(self, property_key: str, value):
+        """Set a property and return its results including the value."""
+        results = super().set_property(property_key, value)
+        if not isinstance(results, list):
+            return results
+        return [
+            {**result, "value": value} if isinstance(result, dict) else result
+            for result in results
+        ]
+
+
+class _FanMiot(_MiotDevice, FanMiot):
+    """Xiaomi Pedestal Fan P9, P10, P11, P18, P30 of python-miio."""
+
+
+class _Fan1C(_MiotDevice, Fan1C):
+    """Xiaomi Pedestal Fan 1C and P8 of python-miio."""
+
+
+def _is_property_results(result) -> bool:
+    """Return true if a response holds the results of MIoT property writes."""
+    return (
+        isinstance(result, list)
+        and len(result) > 0
+        and all(isinstance(prop, dict) and "code" in prop for prop in result)
+    )
+
+
+@dataclass(frozen=True)
+class MiotFanSpec:
+    """Declarative description of a MIoT fan.
+
+    The python-miio device class and its status container are generated from
+    the spec on first use, so only the configured models are materialized.
+    """
+
+    name: str
+    model: str
+    modes: type[Enum]
+    # Property name -> (siid, piid)
+    properties: dict[str, tuple[int, int]]
+    # Action name -> (siid, aiid)
+    actions: dict[str, tuple[int, int]] = field(default_factory=dict)
+    # Properties which cannot be written
+    read_only: frozenset[str] = frozenset()
+    # Status fields exposed under a different name than the property
+    aliases: dict[str, str] = field(default_factory=dict)
+    fan_levels: range = range(1, 5)
+    speeds: range = range(1, 101)
+    angles: tuple[int, ...] = ()
+    vertical_angles: tuple[int, ...] = ()
+    # The delayed turn off has an enable switch next to the delay time
+    delay_switch: bool = False
+
+    @cached_property
+    def device_class(self) -> type["MiotFan"]:
+        """Generate the device class and its status container."""
+        mapping: dict[str, dict[str, Any]] = {
+            name: {"siid": siid, "piid": piid}
+            | ({"access": ["read"]} if name in self.read_only else {})
+            for name, (siid, piid) in self.properties.items()
+        }
+        mapping.update(
+            {
+                name: {"siid": siid, "aiid": aiid}
+                for name, (siid, aiid) in self.actions.items()
+            }
+        )
+        status_class = type(
+            f"FanStatus{self.name}",
+            (_FanStatusMiot,),
+            {
+                "__doc__": f"Container for status reports for Fan{self.name}.",
+                "__module__": __name__,
+                "__slots__": tuple(sorted({*self.properties, *self.aliases})),
+                "_enums": {"mode": self.modes},
+                "_aliases": self.aliases,
+            },
+        )
+        return type(
+            f"Fan{self.name}",
+            (MiotFan,),
+            {
+                "__doc__": f"Main class representing the {self.model} fan.",
+                "__module__": __name__,
+                "mapping": mapping,
+                "spec": self,
+                "_status_class": status_class,
+            },
+        )
+
+
+class MiotFan(_MiotDevice):
+    """Base class of the MIoT fans generated from a ``MiotFanSpec``."""
+
+    spec: MiotFanSpec
+    _status_class: type[_FanStatusMiot]
+
+    def __init__(
+        self,
+        ip: str | None = None,
+        token: str | None = None,
+        start_id: int = 0,
+        debug: int = 0,
+        lazy_discover: bool = True,
+        timeout: int = 5,
+        model: str | None = None,
+    ) -> None:
+        """Initialize."""
+        super().__init__(
+            ip,
+            token,
+            start_id,
+            debug,
+            lazy_discover,
+            timeout,
+            model=model or self.spec.model,
+        )
+
+    # backported and adapted from current master
+    def get_properties_for_mapping(self, *, max_properties=15) -> list:
+        """Retrieve raw properties based on mapping."""
+        mapping = self._get_mapping()
+
+        # We send property key in "did" because it's sent back via response and we can identify the property.
+        properties = [
+            {"did": k, **_filter_request_fields(v)}
+            for k, v in mapping.items()
+            if "aiid" not in v and ("access" not in v or "read" in v["access"])
+        ]
+
+        return self.get_properties(
+            properties, property_getter="get_properties", max_properties=max_properties
+        )
+
+    def status(self):
+        """Retrieve properties."""
+        return self._status_class(
+            {
+                prop["did"]: prop["value"] if prop["code"] == 0 else None
+                for prop in self.get_properties_for_mapping()
+            }
+        )
+
+    def on(self):
+        """Power on."""
+        return self.set_property("power", True)
+
+    def off(self):
+        """Power off."""
+        return self.set_property("power", False)
+
+    def set_speed(self, speed: int):
+        """Set fan speed in percent."""
+        if speed not in self.spec.speeds:
+            raise FanException(f"Invalid speed: {speed}")
+        return self.set_property("fan_speed", speed)
+
+    def set_fan_level(self, level: int):
+        """Set fan level."""
+        if level not in self.spec.fan_levels:
+            raise FanException(f"Invalid fan level: {level}")
+        return self.set_property("fan_level", level)
+
+    def set_oscillate(self, oscillate: bool):
+        """Set horizontal oscillation on/off."""
+        return self.set_property("horizontal_swing", bool(oscillate))
+
+    def set_vertical_oscillate(self, oscillate: bool):
+        """Set vertical oscillation on/off."""
+        return self.set_property("vertical_swing", bool(oscillate))
+
+    def set_angle(self, angle: int):
+        """Set the horizontal oscillation angle."""
+        if angle not in self.spec.angles:
+            raise FanException(
+                "Unsupported angle. Supported values: "
+                + ", ".join(str(i) for i in self.spec.angles)
+            )
+        return self.set_property("horizontal_swing_angle", angle)
+
+    def set_vertical_angle(self, angle: int):
+        """Set the vertical oscillation angle."""
+        if angle not in self.spec.vertical_angles:
+            raise FanException(
+                "Unsupported angle. Supported values: "
+                + ", ".join(str(i) for i in self.spec.vertical_angles)
+            )
+        return self.set_property("vertical_swing_angle", angle)
+
+    def set_mode(self, mode: Enum):
+        """Set mode."""
+        return self.set_property("mode", self.spec.modes[mode.name].value)
+
+    def set_buzzer(self, buzzer: bool):
+        """Set buzzer on/off."""
+        return self.set_property("buzzer", bool(buzzer))
+
+    def set_child_lock(self, lock: bool):
+        """Set child lock on/off."""
+        return self.set_property("child_lock", bool(lock))
+
+    def set_light(self, light: bool):
+        """Set indicator state."""
+        return self.set_property("led", bool(light))
+
+    def delay_off(self, minutes: int):
+        """Set delay off in minutes (0-480). 0 deactivates the timer."""
+        if minutes < 0 or minutes > 480:
+            raise FanException(f"Invalid value for a delayed turn off: {minutes}")
+        if not self.spec.delay_switch:
+            return self.set_property("delay_time", minutes)
+        if minutes == 0:
+            return self.set_property("delay", False)
+        return self.set_property("delay_time", minutes) + self.set_property(
+            "delay", True
+        )
+
+    def turn(self, direction: str, steps: int = 1):
+        """Turn to the given direction by a number of steps.
+
+        The steps are sent back to back, so the device moves once per
+        request instead of once per service call.
+        """
+        directions = [
+            action.removeprefix("turn_")
+            for action in self.spec.actions
+            if action.startswith("turn_")
+        ]
+        if direction not in directions:
+            raise FanException(
+                "Unsupported direction. Supported values: " + ", ".join(directions)
+            )
+        for step in range(steps):
+            if step:
+                time.sleep(TURN_STEP_INTERVAL)
+            result = self.call_action(f"turn_{direction}")
+        return result
+
+
+class DeviceInfoCache:
+    """Persistent cache of the detected model and identity of each host.
+
+    The model detection needs a miIO.info round trip per device. The result
+    is stored in the Home Assistant storage, so the following startups can
+    use it right away (even if the device is offline) and revalidate stale
+    entries in the background.
+    """
+
+    def __init__(self, hass) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY_DEVICE_INFO)
+        self._devices: dict[str, dict[str, Any]] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load the cache from the storage once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            data = await self._store.async_load()
+            if data is not None:
+                self._devices = data.get("devices", {})
+            self._loaded = True
+
+    def get(self, host: str) -> dict[str, Any] | None:
+        """Return the cached device info of a host."""
+        return self._devices.get(host)
+
+    def is_stale(self, host: str) -> bool:
+        """Return true if the device info of a host must be revalidated."""
+        device_info = self._devices.get(host)
+        if device_info is None:
+            return True
+
+        age = time.time() - device_info.get(ATTR_DETECTED_AT, 0)
+        return age > DEVICE_INFO_REVALIDATE_INTERVAL.total_seconds()
+
+    async def async_detect(self, host: str, token: str) -> dict[str, Any]:
+        """Query the device info of a host and store it."""
+        miio_device = Device(host, token)
+        async with async_get_request_limiter(self._hass).async_slot(host):
+            info = await self._hass.async_add_executor_job(miio_device.info)
+        _LOGGER.info(
+            "%s %s %s detected",
+            info.model,
+            info.firmware_version,
+            info.hardware_version,
+        )
+
+        device_info = {
+            ATTR_MODEL: info.model,
+            ATTR_MAC_ADDRESS: info.mac_address,
+            ATTR_FIRMWARE_VERSION: info.firmware_version,
+            ATTR_HARDWARE_VERSION: info.hardware_version,
+            ATTR_DETECTED_AT: time.time(),
+        }
+        self._devices[host] = device_info
+        self._store.async_delay_save(self._data_to_save, DEVICE_INFO_SAVE_DELAY)
+        return device_info
+
+    async def async_revalidate(self, host: str, token: str) -> None:
+        """Refresh the cached device info of a host in the background."""
+        cached = self._devices.get(host)
+        try:
+            device_info = await self.async_detect(host, token)
+        except DeviceException as ex:
+            _LOGGER.debug("Revalidating the device info of %s failed: %s", host, ex)
+            return
+
+        if cached is not None and (
+            cached[ATTR_MODEL] != device_info[ATTR_MODEL]
+            or cached[ATTR_MAC_ADDRESS] != device_info[ATTR_MAC_ADDRESS]
+        ):
+            _LOGGER.warning(
+                "The device at %s changed from %s to %s. "
+                "Please restart Home Assistant to apply the change",
+                host,
+                cached[ATTR_MODEL],
+                device_info[ATTR_MODEL],
+            )
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the storage."""
+        return {"devices": self._devices}
+
+
+async def async_get_device_info_cache(hass) -> DeviceInfoCache:
+    """Return the loaded device info cache shared by all hosts."""
+    if DATA_KEY_DEVICE_INFO not in hass.data:
+        hass.data[DATA_KEY_DEVICE_INFO] = DeviceInfoCache(hass)
+
+    device_info_cache = hass.data[DATA_KEY_DEVICE_INFO]
+    await device_info_cache.async_load()
+    return device_info_cache
+
+
+class PollScheduler:
+    """Schedule the polls of the fans.
+
+    The entities are added without polling them first. Their first refresh
+    is delayed by a random jitter and runs with a bounded concurrency, so a
+    fleet of fans doesn't send its first requests at the same moment.
+
+    Afterwards each fan is polled at a stable phase offset within the scan
+    interval, derived from a hash of its unique id. The polls of the fleet
+    are spread over the interval instead of being sent in bursts.
+    """
+
+    def __init__(self, hass) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._semaphore = asyncio.Semaphore(FIRST_REFRESH_CONCURRENCY)
+
+    @staticmethod
+    def phase(key: str, interval: float) -> float:
+        """Return the offset of the polls of a device within the interval."""
+        return zlib.crc32(key.encode()) / 2**32 * interval
+
+    @callback
+    def async_schedule(self, entity: "XiaomiGenericDevice") -> CALLBACK_TYPE:
+        """Start polling an entity and return the callback stopping it."""
+        task = self._hass.async_create_background_task(
+            self._async_poll(entity),
+            f"{DOMAIN} polling of {entity.entity_id}",
+        )
+        return task.cancel
+
+    async def _async_poll(self, entity: "XiaomiGenericDevice") -> None:
+        """Poll an entity until the task is cancelled."""
+        await asyncio.sleep(random.uniform(0, FIRST_REFRESH_JITTER))
+        async with self._semaphore:
+            await entity.async_update_ha_state(True)
+
+        interval = entity.platform.scan_interval.total_seconds()
+        phase = self.phase(entity.unique_id or entity.entity_id, interval)
+        while True:
+            await asyncio.sleep(interval - (time.time() - phase) % interval)
+            await entity.async_update_ha_state(True)
+
+
+@callback
+def async_get_poll_scheduler(hass) -> PollScheduler:
+    """Return the poll scheduler shared by all fans."""
+    if DATA_KEY_POLL_SCHEDULER not in hass.data:
+        hass.data[DATA_KEY_POLL_SCHEDULER] = PollScheduler(hass)
+
+    return hass.data[DATA_KEY_POLL_SCHEDULER]
+
+
+class RequestLimiter:
+    """Bound the miIO requests in flight.
+
+    The fans process one request at a time, so the requests to a host are
+    serialized. Across all hosts at most ``limit`` requests are in flight,
+    so a large scene plus a poll cycle can't saturate the executor and the
+    access points. ``queue_depth`` is the number of requests waiting.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the limiter."""
+        self.limit = limit
+        self.queue_depth = 0
+        self._semaphore = asyncio.Semaphore(limit)
+        self._host_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    @asynccontextmanager
+    async def async_slot(self, host: str) -> AsyncIterator[None]:
+        """Wait until a request to the host may be sent."""
+        self.queue_depth += 1
+        queued = True
+        try:
+            async with self._host_locks[host], self._semaphore:
+                self.queue_depth -= 1
+                queued = False
+                yield
+        finally:
+            if queued:
+                self.queue_depth -= 1
+
+
+@callback
+def async_get_request_limiter(hass) -> RequestLimiter:
+    """Return the request limiter shared by all hosts."""
+    if DATA_KEY_REQUEST_LIMITER not in hass.data:
+        hass.data[DATA_KEY_REQUEST_LIMITER] = RequestLimiter(
+            hass.data[DOMAIN][CONF_MAX_CONCURRENT_REQUESTS]
+        )
+
+    return hass.data[DATA_KEY_REQUEST_LIMITER]
+
+
+# pylint: disable=unused-argument
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Set up the miio fan device from config."""
+    if DATA_KEY not in hass.data:
+        hass.data[DATA_KEY] = {}
+
+    host = config[CONF_HOST]
+    token = config[CONF_TOKEN]
+    name = config[CONF_NAME]
+    model = config.get(CONF_MODEL)
+    retries = config[CONF_RETRIES]
+    preset_modes_override = config.get(CONF_PRESET_MODES_OVERRIDE)
+    status_cache_ttl = config[CONF_STATUS_CACHE_TTL]
+    attribute_filters = config[CONF_ATTRIBUTE_FILTERS]
+
+    _LOGGER.info("Initializing with host %s (token %s...)", host, token[:5])
+    unique_id = None
+
+    if model is None:
+        device_info_cache = await async_get_device_info_cache(hass)
+        device_info = device_info_cache.get(host)
+        if device_info is None:
+            try:
+                device_info = await device_info_cache.async_detect(host, token)
+            except DeviceException as ex:
+                raise PlatformNotReady from ex
+        elif device_info_cache.is_stale(host):
+            hass.async_create_task(device_info_cache.async_revalidate(host, token))
+
+        model = device_info[ATTR_MODEL]
+        unique_id = f"{model}-{device_info[ATTR_MAC_ADDRESS]}"
+
+    fan_model = FAN_MODELS.get(model)
+    if fan_model is None:
+        _LOGGER.error(
+            "Unsupported device found! Please create an issue at "
+            "https://github.com/syssi/xiaomi_fan/issues "
+            "and provide the following data: %s",
+            model,
+        )
+        return False
+
+    fan = fan_model.device_class(host, token, model=fan_model.mapping_model or model)
+    if config[CONF_HEDGE_REQUESTS]:
+        fan._protocol = HedgedMiIOProtocol(host, token, timeout=fan._protocol._timeout)
+    device = fan_model.entity_class(
+        name,
+        fan,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    )
+
+    environment_sensors = (
+        config[CONF_ENVIRONMENT_SENSORS] and model in ENVIRONMENT_SENSOR_MODELS
+    )
+    if environment_sensors:
+        # The sensors report the readings instead of the fan state
+        device.remove_attributes({ATTR_TEMPERATURE, ATTR_HUMIDITY})
+
+    hass.data[DATA_KEY][host] = device
+    async_add_entities([device])
+
+    if config[CONF_DIAGNOSTIC_SENSORS] or environment_sensors:
+        hass.async_create_task(
+            async_load_platform(
+                hass,
+                Platform.SENSOR,
+                DOMAIN,
+                {
+                    CONF_HOST: host,
+                    CONF_DIAGNOSTIC_SENSORS: config[CONF_DIAGNOSTIC_SENSORS],
+                    CONF_ENVIRONMENT_SENSORS: environment_sensors,
+                },
+                hass.data[DATA_KEY_HASS_CONFIG],
+            )
+        )
+
+    async def async_service_handler(service):
+        """Map services to methods on XiaomiFan."""
+        method = SERVICE_TO_METHOD.get(service.service)
+        params = {
+            key: value for key, value in service.data.items() if key != ATTR_ENTITY_ID
+        }
+        entity_ids = service.data.get(ATTR_ENTITY_ID)
+        if entity_ids:
+            devices = [
+                device
+                for device in hass.data[DATA_KEY].values()
+                if device.entity_id in entity_ids
+            ]
+        else:
+            devices = hass.data[DATA_KEY].values()
+
+        # The commands schedule the refresh of the state themselves
+        for device in devices:
+            if not hasattr(device, method["method"]):
+                continue
+            await getattr(device, method["method"])(**params)
+
+    for air_purifier_service, air_purifier_method in SERVICE_TO_METHOD.items():
+        schema = air_purifier_method.get("schema", AIRPURIFIER_SERVICE_SCHEMA)
+        hass.services.async_register(
+            DOMAIN, air_purifier_service, async_service_handler, schema=schema
+        )
+
+    async def async_diagnostics_service_handler(
+        service: ServiceCall,
+    ) -> ServiceResponse:
+        """Return the diagnostics of the fans by entity id."""
+        entity_ids = service.data.get(ATTR_ENTITY_ID)
+        device_info_cache = await async_get_device_info_cache(hass)
+        return {
+            device.entity_id: async_get_fan_diagnostics(
+                device, device_info_cache.get(host)
+            )
+            for host, device in hass.data[DATA_KEY].items()
+            if not entity_ids or device.entity_id in entity_ids
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DIAGNOSTICS,
+        async_diagnostics_service_handler,
+        schema=AIRPURIFIER_SERVICE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+class XiaomiGenericDevice(FanEntity, RestoreEntity):
+    """Representation of a generic Xiaomi device."""
+
+    _enable_turn_on_off_backwards_compatibility = False
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the generic Xiaomi device."""
+        self._name = name
+        self._device = device
+        self._model = model
+        self._unique_id = unique_id
+        self._retry = 0
+        self._retries = retries
+        self._preset_modes_override = preset_modes_override
+        self._status_cache_ttl = status_cache_ttl
+        self._attribute_filters = {
+            attribute: AttributeFilter(**options)
+            for attribute, options in attribute_filters.items()
+        }
+
+        self._available = False
+        self._state = None
+        self._device_features = FAN_MODELS[model].features
+        self._available_attributes = FAN_MODELS[model].attributes
+        self._state_attrs = {
+            ATTR_MODEL: self._model,
+            **{attribute: None for attribute in self._available_attributes},
+        }
+        self._delay_off_unit = FAN_MODELS[model].delay_off_unit
+        self._delay_off_remaining = FAN_MODELS[model].delay_off_remaining
+        self._delay_off_switch = FAN_MODELS[model].delay_off_switch
+        self._delay_off_deadlines = FAN_MODELS[model].delay_off_deadline
+        # Delay off timer as of its last sync and the status it was synced to
+        self._delay_off_countdown = None
+        self._delay_off_deadline = None
+        self._delay_off_synced = None
+        self._delay_off_status = None
+        self._skip_update = False
+        self._polled = False
+        # The state is restored and no poll succeeded yet
+        self._stale = False
+        self._status_fingerprint = None
+        self._status_unchanged = False
+        self._last_written_state = None
+        self._refresh_debouncer = None
+        self._stats = RequestStats(model)
+        self._last_status = None
+        # Time and result of the last status fetch, and the fetch in flight
+        self._status_cache = None
+        self._status_fetch = None
+        # Status after the successful writes of the last command
+        self._written_status = None
+        # Number of properties requested per status poll of the MIoT devices
+        self._status_batch_size = (
+            sum("aiid" not in prop for prop in device._get_mapping().values())
+            if isinstance(device, MiotDevice)
+            else None
+        )
+
+    @property
+    def supported_features(self):
+        """Flag supported features."""
+        return 0
+
+    @property
+    def should_poll(self):
+        """Return false, the polls are spread by the poll scheduler."""
+        return False
+
+    @property
+    def unique_id(self):
+        """Return an unique ID."""
+        return self._unique_id
+
+    @property
+    def name(self):
+        """Return the name of the device if any."""
+        return self._name
+
+    @property
+    def available(self):
+        """Return true when state is known."""
+        # The state is unknown rather than unavailable until the first poll
+        return self._available or not self._polled
+
+    @property
+    def extra_state_attributes(self):
+        """Return the extra state attributes of the device."""
+        if (
+            not self._attribute_filters
+            and ATTR_DELAY_OFF_COUNTDOWN not in self._available_attributes
+            and not self._stale
+        ):
+            return self._state_attrs
+
+        attributes = {
+            **self._state_attrs,
+            **{
+                attribute: attribute_filter.value
+                for attribute, attribute_filter in self._attribute_filters.items()
+                if attribute in self._state_attrs
+            },
+        }
+        if ATTR_DELAY_OFF_COUNTDOWN in self._available_attributes:
+            attributes[ATTR_DELAY_OFF_COUNTDOWN] = self._delay_off_countdown
+            if self._delay_off_deadlines:
+                attributes[ATTR_DELAY_OFF_DEADLINE] = self._delay_off_deadline
+        if self._stale:
+            attributes[ATTR_STALE] = True
+        return attributes
+
+    def remove_attributes(self, attributes: set[str]) -> None:
+        """Stop reporting the given state attributes."""
+        self._available_attributes = {
+            attribute: value
+            for attribute, value in self._available_attributes.items()
+            if attribute not in attributes
+        }
+        for attribute in attributes:
+            self._state_attrs.pop(attribute, None)
+
+    @property
+    def request_stats(self) -> RequestStats:
+        """Return the statistics of the requests to the device."""
+        return self._stats
+
+    @property
+    def device(self) -> Device:
+        """Return the python-miio device."""
+        return self._device
+
+    @property
+    def last_status(self) -> DeviceStatus | _FanStatusMiot | None:
+        """Return the status of the last successful poll."""
+        return self._last_status
+
+    @property
+    def failed_polls(self) -> int:
+        """Return the number of failed polls since the last successful one."""
+        return self._retry
+
+    @property
+    def retries(self) -> int:
+        """Return the number of failed polls making the device unavailable."""
+        return self._retries
+
+    @property
+    def is_on(self):
+        """Return true if device is on."""
+        return self._state
+
+    @staticmethod
+    def _extract_value_from_attribute(state, attribute):
+        value = getattr(state, attribute, None)
+        if isinstance(value, Enum):
+            return value.value
+
+        return value
+
+    def _sync_delay_off(self) -> None:
+        """Turn the remaining time of the delay off timer into a deadline.
+
+        The remaining time changes with every poll, so the deadline and the
+        countdown attributes are only moved if the deadline drifted or the
+        last sync is a while ago. This keeps a running timer from writing a
+        new state on every poll. Models reporting only the configured length
+        of the timer get no deadline.
+        """
+        status = self._last_status
+        if status is None or status is self._delay_off_status:
+            return
+        self._delay_off_status = status
+
+        countdown = self._extract_value_from_attribute(
+            status, self._available_attributes[ATTR_DELAY_OFF_COUNTDOWN]
+        )
+        remaining = countdown
+        if self._delay_off_remaining is not None:
+            remaining = self._extract_value_from_attribute(
+                status, self._delay_off_remaining
+            )
+        if self._delay_off_switch is not None and not (
+            self._extract_value_from_attribute(status, self._delay_off_switch)
+        ):
+            remaining = 0
+        now = dt_util.utcnow()
+        deadline = (
+            now + timedelta(seconds=remaining * self._delay_off_unit)
+            if remaining and self._delay_off_deadlines
+            else None
+        )
+        if (
+            deadline is not None
+            and self._delay_off_deadline is not None
+            and abs(deadline - self._delay_off_deadline) <= DELAY_OFF_DEADLINE_TOLERANCE
+            and now - self._delay_off_synced < DELAY_OFF_RESYNC_INTERVAL
+            and (
+                self._delay_off_remaining is None
+                or countdown == self._delay_off_countdown
+            )
+        ):
+            return
+
+        self._delay_off_countdown = countdown
+        self._delay_off_deadline = deadline
+        self._delay_off_synced = now
+
+    def _update_status_fingerprint(self, state) -> bool:
+        """Remember the fingerprint of a status report.
+
+        Returns False if the status is the same as the one of the previous
+        poll, so the entity state doesn't need to be recomputed or written.
+        """
+        if isinstance(state, _FanStatusMiot):
+            fingerprint = tuple(getattr(state, field) for field in state._fields)
+        elif isinstance(getattr(state, "data", None), dict):
+            fingerprint = tuple(state.data.items())
+        else:
+            fingerprint = None
+
+        if (
+            fingerprint is not None
+            and fingerprint == self._status_fingerprint
+            and self._available
+        ):
+            self._status_unchanged = True
+            return False
+
+        self._status_fingerprint = fingerprint
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last state and start polling the entity."""
+        await super().async_added_to_hass()
+        if (last_state := await self.async_get_last_state()) is not None:
+            self._restore_state(last_state)
+        self._refresh_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=COMMAND_REFRESH_COOLDOWN,
+            immediate=True,
+            function=partial(self.async_update_ha_state, True),
+        )
+        self.async_on_remove(self._refresh_debouncer.async_cancel)
+        self.async_on_remove(async_get_poll_scheduler(self.hass).async_schedule(self))
+
+    def _restore_state(self, state: State) -> None:
+        """Show the state of the last run until the first poll succeeds.
+
+        The restored state is marked with the ``stale`` attribute. Like a
+        polled state, it stays available until the polls failed as often as
+        the configured retries.
+        """
+        if state.state not in (STATE_ON, STATE_OFF):
+            return
+
+        attributes = state.attributes
+        self._state = state.state == STATE_ON
+        self._available = True
+        self._stale = True
+        self._state_attrs.update(
+            {
+                attribute: attributes[attribute]
+                for attribute in self._state_attrs
+                if attribute in attributes
+            }
+        )
+        for attribute, attribute_filter in self._attribute_filters.items():
+            attribute_filter.value = attributes.get(attribute)
+        if hasattr(self, "_percentage"):
+            self._percentage = attributes.get(ATTR_PERCENTAGE)
+        if hasattr(self, "_preset_mode"):
+            self._preset_mode = attributes.get(ATTR_PRESET_MODE)
+        if hasattr(self, "_oscillate"):
+            self._oscillate = attributes.get(ATTR_OSCILLATING)
+
+        if ATTR_DELAY_OFF_COUNTDOWN in self._available_attributes:
+            deadline = (
+                attributes.get(ATTR_DELAY_OFF_DEADLINE)
+                if self._delay_off_deadlines
+                else None
+            )
+            if isinstance(deadline, str):
+                deadline = dt_util.parse_datetime(deadline)
+            # The deadline survives the restart, the first poll checks it
+            self._delay_off_countdown = attributes.get(ATTR_DELAY_OFF_COUNTDOWN)
+            self._delay_off_deadline = deadline
+            self._delay_off_synced = dt_util.utcnow()
+
+    async def async_update_ha_state(self, force_refresh: bool = False) -> None:
+        """Update Home Assistant unless the entity state is unchanged."""
+        if force_refresh:
+            if self._refresh_debouncer is not None:
+                self._refresh_debouncer.async_cancel()
+            self._status_unchanged = False
+            if self._written_status is not None:
+                # The status after the command is known, nothing stale is read
+                self._skip_update = False
+            retry = self._retry
+            try:
+                await self.async_device_update()
+            except Exception:
+                _LOGGER.exception("Update for %s fails", self.entity_id)
+                return
+            finally:
+                self._written_status = None
+                self._polled = True
+                if self._last_status is not None and not self._retry:
+                    self._stale = False
+                if self._retry > retry:
+                    self._stats.retries += 1
+                async_dispatcher_send(self.hass, SIGNAL_POLLED.format(self._device.ip))
+
+            if ATTR_DELAY_OFF_COUNTDOWN in self._available_attributes:
+                self._sync_delay_off()
+            for attribute, attribute_filter in self._attribute_filters.items():
+                published = attribute_filter.value
+                attribute_filter.filter(self._state_attrs.get(attribute))
+                # A change held back by the minimum interval may be published
+                # by a poll which reports an unchanged status
+                if attribute_filter.value != published:
+                    self._status_unchanged = False
+
+        if self._status_unchanged:
+            return
+
+        if self._current_entity_state() == self._last_written_state:
+            return
+
+        self.async_write_ha_state()
+
+    def _current_entity_state(self) -> tuple:
+        """Return the entity state as it would be written to Home Assistant."""
+        return (
+            self.available,
+            self.is_on,
+            self.percentage,
+            self.preset_mode,
+            self.oscillating,
+            self.current_direction,
+            tuple(self.extra_state_attributes.items()),
+        )
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine and remember it."""
+        self._last_written_state = self._current_entity_state()
+        super().async_write_ha_state()
+
+    async def _async_device_call(self, func, *args, **kwargs):
+        """Call a miio device method in the executor once the host is free."""
+        async with async_get_request_limiter(self.hass).async_slot(self._device.ip):
+            protocol = self._device._protocol
+            discovered = protocol._discovered
+            start = time.monotonic()
+            try:
+                result = await self.hass.async_add_executor_job(
+                    partial(func, *args, **kwargs)
+                )
+            except FanException:
+                # Rejected before sending anything
+                raise
+            except DeviceException as ex:
+                self._record_request(func, start, ex)
+                raise
+            finally:
+                if protocol._discovered and not discovered:
+                    self._stats.last_handshake = time.monotonic()
+
+            self._record_request(func, start)
+            if func == self._device.status:
+                self._last_status = result
+            return result
+
+    async def _async_status(self):
+        """Return the status of the device.
+
+        Concurrent callers share a single fetch and a status fetched less
+        than the cache TTL ago is returned without a request. So is the
+        status known from the writes of the last command.
+        """
+        if self._written_status is not None:
+            status, self._written_status = self._written_status, None
+            self._last_status = status
+            self._status_cache = (time.monotonic(), status)
+            return status
+
+        if self._status_cache is not None:
+            fetched, status = self._status_cache
+            if time.monotonic() - fetched < self._status_cache_ttl:
+                return status
+
+        if self._status_fetch is None:
+            self._status_fetch = self.hass.async_create_task(self._async_fetch_status())
+            self._status_fetch.add_done_callback(self._status_fetch_done)
+        # A cancelled caller must not cancel the fetch of the other callers
+        return await asyncio.shield(self._status_fetch)
+
+    async def _async_fetch_status(self):
+        """Fetch the status of the device and cache it."""
+        status = await self._async_device_call(self._device.status)
+        self._status_cache = (time.monotonic(), status)
+        return status
+
+    def _status_fetch_done(self, task: asyncio.Task) -> None:
+        """Forget the finished status fetch."""
+        self._status_fetch = None
+        if not task.cancelled():
+            # The error is raised to the callers, if any are left
+            task.exception()
+
+    def _record_request(self, func, start: float, error: Exception | None = None):
+        """Add a request to the statistics of the device."""
+        self._stats.record(
+            func.__name__,
+            (time.monotonic() - start) * 1000,
+            error_code=error_code(error) if error is not None else None,
+            batch_size=self._status_batch_size if func == self._device.status else None,
+        )
+
+    async def _try_command(self, mask_error, func, *args, **kwargs):
+        """Call a miio device command handling error messages."""
+        # The next poll must not be skipped even if the status looks unchanged.
+        self._status_fingerprint = None
+        written_status = None
+        try:
+            result = await self._async_device_call(func, *args, **kwargs)
+
+            _LOGGER.debug("Response received from miio device: %s", result)
+
+            if _is_property_results(result):
+                written_status = self._status_with_written_properties(result)
+                return all(prop["code"] == 0 for prop in result)
+            return result == SUCCESS
+        except FanException as exc:
+            _LOGGER.warning(mask_error, exc)
+            return False
+        except DeviceException as exc:
+            _LOGGER.error(mask_error, exc)
+            self._available = False
+            return False
+        finally:
+            # A status fetched before the command finished is outdated. The
+            # requests to a host are serialized, so a fetch still in flight
+            # sends its request after the command.
+            self._status_cache = None
+            # The refresh after successful writes applies them to the status
+            # instead of reading it back. Other commands have unknown effects.
+            self._written_status = written_status
+            # Home Assistant doesn't refresh entities without polling after a
+            # service call, so the state is refreshed right after the command
+            # and once more after a burst of commands settled.
+            if self._refresh_debouncer is not None:
+                self._refresh_debouncer.async_schedule_call()
+
+    def _status_with_written_properties(self, results):
+        """Return the known status updated with the written property values.
+
+        Returns None unless every property was written successfully and a
+        status of the device is known.
+        """
+        status = self._written_status or self._last_status
+        if any(
+            prop["code"] != 0 or "did" not in prop or "value" not in prop
+            for prop in results
+        ):
+            return None
+        written = {prop["did"]: prop["value"] for prop in results}
+        if isinstance(status, _FanStatusMiot):
+            return status._replace(written)
+        if isinstance(getattr(status, "data", None), dict):
+            return type(status)({**status.data, **written})
+        return None
+
+    async def async_turn_on(
+        self,
+        percentage: int | None = None,
+        preset_mode: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Turn the device on."""
+        if percentage == 0 or preset_mode == SPEED_OFF:
+            await self.async_turn_off(**kwargs)
+            return
+
+        if percentage is not None:
+            await self.async_set_percentage(percentage)
+        elif preset_mode is not None:
+            await self.async_set_preset_mode(preset_mode)
+        else:
+            result = await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+
+            if not result:
+                return
+
+        self._state = True
+        self._skip_update = True
+
+    async def async_turn_off(self, **kwargs) -> None:
+        """Turn the device off."""
+        result = await self._try_command(
+            "Turning the miio device off failed.", self._device.off
+        )
+
+        if result:
+            self._state = False
+            self._skip_update = True
+
+    async def async_set_buzzer_on(self):
+        """Turn the buzzer on."""
+        if self._device_features & FEATURE_SET_BUZZER == 0:
+            return
+
+        await self._try_command(
+            "Turning the buzzer of the miio device on failed.",
+            self._device.set_buzzer,
+            True,
+        )
+
+    async def async_set_buzzer_off(self):
+        """Turn the buzzer off."""
+        if self._device_features & FEATURE_SET_BUZZER == 0:
+            return
+
+        await self._try_command(
+            "Turning the buzzer of the miio device off failed.",
+            self._device.set_buzzer,
+            False,
+        )
+
+    async def async_set_child_lock_on(self):
+        """Turn the child lock on."""
+        if self._device_features & FEATURE_SET_CHILD_LOCK == 0:
+            return
+
+        await self._try_command(
+            "Turning the child lock of the miio device on failed.",
+            self._device.set_child_lock,
+            True,
+        )
+
+    async def async_set_child_lock_off(self):
+        """Turn the child lock off."""
+        if self._device_features & FEATURE_SET_CHILD_LOCK == 0:
+            return
+
+        await self._try_command(
+            "Turning the child lock of the miio device off failed.",
+            self._device.set_child_lock,
+            False,
+        )
+
+
+class XiaomiFan(XiaomiGenericDevice):
+    """Representation of a Xiaomi Pedestal Fan."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._percentage = None
+        self._preset_modes = list(FAN_PRESET_MODES)
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+
+        self._preset_mode = None
+        self._oscillate = None
+        self._natural_mode = False
+
+    @property
+    def supported_features(self) -> int:
+        """Supported features."""
+        return (
+            FanEntityFeature.SET_SPEED
+            | FanEntityFeature.PRESET_MODE
+            | FanEntityFeature.OSCILLATE
+            | FanEntityFeature.DIRECTION
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.TURN_ON
+        )
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        # On state change the device doesn't provide the new state immediately.
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._oscillate = state.oscillate
+            self._natural_mode = state.natural_speed != 0
+            self._state = state.is_on
+
+            if self._natural_mode:
+                for preset_mode, range in FAN_PRESET_MODES.items():
+                    if state.natural_speed in range:
+                        self._preset_mode = preset_mode
+                        self._percentage = state.natural_speed
+                        break
+            else:
+                for preset_mode, range in FAN_PRESET_MODES.items():
+                    if state.direct_speed in range:
+                        self._preset_mode = preset_mode
+                        self._percentage = state.direct_speed
+                        break
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                }
+            )
+            self._retry = 0
+
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    @property
+    def percentage(self):
+        """Return the current speed."""
+        return self._percentage
+
+    @property
+    def preset_modes(self):
+        """Get the list of available preset modes."""
+        return self._preset_modes
+
+    @property
+    def preset_mode(self):
+        """Get the current preset mode."""
+        return self._preset_mode
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set the preset mode of the fan."""
+        _LOGGER.debug("Setting the preset mode to: %s", preset_mode)
+
+        if preset_mode == SPEED_OFF:
+            await self.async_turn_off()
+            return
+
+        if self._natural_mode:
+            await self._try_command(
+                "Setting fan speed of the miio device failed.",
+                self._device.set_natural_speed,
+                FAN_PRESET_MODE_VALUES[preset_mode],
+            )
+        else:
+            await self._try_command(
+                "Setting fan speed of the miio device failed.",
+                self._device.set_direct_speed,
+                FAN_PRESET_MODE_VALUES[preset_mode],
+            )
+
+    async def async_set_percentage(self, percentage: int) -> None:
+        """Set the speed percentage of the fan."""
+        _LOGGER.debug("Setting the fan speed percentage to: %s", percentage)
+
+        if percentage == 0:
+            await self.async_turn_off()
+            return
+
+        if self._natural_mode:
+            await self._try_command(
+                "Setting fan speed percentage of the miio device failed.",
+                self._device.set_natural_speed,
+                percentage,
+            )
+        else:
+            await self._try_command(
+                "Setting fan speed percentage of the miio device failed.",
+                self._device.set_direct_speed,
+                percentage,
+            )
+
+    async def async_set_direction(self, direction: str) -> None:
+        """Set the direction of the fan."""
+        if direction == "forward":
+            direction = "right"
+
+        if direction == "reverse":
+            direction = "left"
+
+        if self._oscillate:
+            await self._try_command(
+                "Setting oscillate off of the miio device failed.",
+                self._device.set_oscillate,
+                False,
+            )
+
+        await self._try_command(
+            "Setting move direction of the miio device failed.",
+            self._device.set_rotate,
+            FanMoveDirection(direction),
+        )
+
+    @property
+    def oscillating(self):
+        """Return the oscillation state."""
+        return self._oscillate
+
+    async def async_oscillate(self, oscillating: bool) -> None:
+        """Set oscillation."""
+        if oscillating:
+            await self._try_command(
+                "Setting oscillate on of the miio device failed.",
+                self._device.set_oscillate,
+                True,
+            )
+        else:
+            await self._try_command(
+                "Setting oscillate off of the miio device failed.",
+                self._device.set_oscillate,
+                False,
+            )
+
+    async def async_set_oscillation_angle(self, angle: int) -> None:
+        """Set oscillation angle."""
+        if self._device_features & FEATURE_SET_OSCILLATION_ANGLE == 0:
+            return
+
+        await self._try_command(
+            "Setting angle of the miio device failed.", self._device.set_angle, angle
+        )
+
+    async def async_set_delay_off(self, delay_off_countdown: int) -> None:
+        """Set scheduled off timer in minutes."""
+
+        await self._try_command(
+            "Setting delay off miio device failed.",
+            self._device.delay_off,
+            delay_off_countdown * 60,
+        )
+
+    async def async_set_led_brightness(self, brightness: int = 2):
+        """Set the led brightness."""
+        if self._device_features & FEATURE_SET_LED_BRIGHTNESS == 0:
+            return
+
+        await self._try_command(
+            "Setting the led brightness of the miio device failed.",
+            self._device.set_led_brightness,
+            FanLedBrightness(brightness),
+        )
+
+    async def async_set_natural_mode_on(self):
+        """Turn the natural mode on."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+
+        self._natural_mode = True
+        await self.async_set_percentage(self._percentage)
+
+    async def async_set_natural_mode_off(self):
+        """Turn the natural mode off."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+
+        self._natural_mode = False
+        await self.async_set_percentage(self._percentage)
+
+    async def async_set_vertical_oscillation_angle(self, vertical_angle: int) -> None:
+        """Set vertical oscillation angle."""
+        if self._device_features & FEATURE_SET_VERTICAL_OSCILLATION_ANGLE == 0:
+            return
+
+        await self._try_command(
+            "Setting vertical oscillation angle of the miio device failed.",
+            self._device.set_vertical_angle,
+            vertical_angle,
+        )
+
+
+class XiaomiFanP5(XiaomiFan):
+    """Representation of a Xiaomi Pedestal Fan P5."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._percentage = None
+        self._preset_modes = list(FAN_PRESET_MODES)
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+
+        self._preset_mode = None
+        self._oscillate = None
+        self._natural_mode = False
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        # On state change the device doesn't provide the new state immediately.
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._percentage = state.speed
+            self._oscillate = state.oscillate
+            self._natural_mode = state.mode == FanOperationMode.Nature
+            self._state = state.is_on
+
+            for preset_mode, range in FAN_PRESET_MODES.items():
+                if state.speed in range:
+                    self._preset_mode = preset_mode
+                    break
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                }
+            )
+
+            self._retry = 0
+
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set the preset mode of the fan."""
+        _LOGGER.debug("Setting the preset mode to: %s", preset_mode)
+
+        if preset_mode == SPEED_OFF:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+        await self._try_command(
+            "Setting fan speed of the miio device failed.",
+            self._device.set_speed,
+            FAN_PRESET_MODE_VALUES_P5[preset_mode],
+        )
+
+    async def async_set_percentage(self, percentage: int) -> None:
+        """Set the speed percentage of the fan."""
+        _LOGGER.debug("Setting the fan speed percentage to: %s", percentage)
+
+        if percentage == 0:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+        await self._try_command(
+            "Setting fan speed percentage of the miio device failed.",
+            self._device.set_speed,
+            percentage,
+        )
+
+    async def async_set_natural_mode_on(self):
+        """Turn the natural mode on."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+
+        await self._try_command(
+            "Turning on natural mode of the miio device failed.",
+            self._device.set_mode,
+            FanOperationMode.Nature,
+        )
+
+    async def async_set_natural_mode_off(self):
+        """Turn the natural mode off."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+
+        await self._try_command(
+            "Turning on natural mode of the miio device failed.",
+            self._device.set_mode,
+            FanOperationMode.Normal,
+        )
+
+    async def async_set_delay_off(self, delay_off_countdown: int) -> None:
+        """Set scheduled off timer in minutes."""
+
+        await self._try_command(
+            "Setting delay off miio device failed.",
+            self._device.delay_off,
+            delay_off_countdown,
+        )
+
+    async def async_set_led_brightness(self, brightness: int = 2):
+        """Set LED on (brightness != 2) or off (brightness == 2)."""
+        if self._device_features & FEATURE_SET_LED == 0:
+            return
+        await self._try_command(
+            "Setting LED of the miio device failed.",
+            self._device.set_led,
+            brightness != 2,
+        )
+
+
+class XiaomiFanMiot(XiaomiFanP5):
+    """Representation of a Xiaomi Pedestal Fan P9, P10, P11, P18, P30."""
+
+    pass
+
+
+class XiaomiFanLeshow(XiaomiGenericDevice):
+    """Representation of a Xiaomi Fan Leshow SS4."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._percentage = None
+        self._preset_modes = [mode.name for mode in FanLeshowOperationMode]
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+        self._oscillate = None
+
+    @property
+    def supported_features(self) -> int:
+        """Supported features."""
+        return (
+            FanEntityFeature.SET_SPEED
+            | FanEntityFeature.PRESET_MODE
+            | FanEntityFeature.OSCILLATE
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.TURN_ON
+        )
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        # On state change the device doesn't provide the new state immediately.
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._percentage = state.speed
+            self._oscillate = state.oscillate
+            self._state = state.is_on
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                }
+            )
+            self._retry = 0
+
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    @property
+    def percentage(self):
+        """Return the current speed."""
+        return self._percentage
+
+    @property
+    def preset_modes(self):
+        """Get the list of available preset modes."""
+        return self._preset_modes
+
+    @property
+    def preset_mode(self):
+        """Get the current preset mode."""
+        if self._state:
+            return FanLeshowOperationMode(self._state_attrs[ATTR_MODE]).name
+
+        return None
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set the preset mode of the fan."""
+        _LOGGER.debug("Setting the preset mode to: %s", preset_mode)
+
+        await self._try_command(
+            "Setting preset mode of the miio device failed.",
+            self._device.set_mode,
+            FanLeshowOperationMode[preset_mode.title()],
+        )
+
+    async def async_set_percentage(self, percentage: int) -> None:
+        """Set the speed percentage of the fan."""
+        _LOGGER.debug("Setting the fan speed percentage to: %s", percentage)
+
+        if percentage == 0:
+            await self.async_turn_off()
+            return
+
+        await self._try_command(
+            "Setting fan speed percentage of the miio device failed.",
+            self._device.set_speed,
+            percentage,
+        )
+
+    @property
+    def oscillating(self):
+        """Return the oscillation state."""
+        return self._oscillate
+
+    async def async_oscillate(self, oscillating: bool) -> None:
+        """Set oscillation."""
+        if oscillating:
+            await self._try_command(
+                "Setting oscillate on of the miio device failed.",
+                self._device.set_oscillate,
+                True,
+            )
+        else:
+            await self._try_command(
+                "Setting oscillate off of the miio device failed.",
+                self._device.set_oscillate,
+                False,
+            )
+
+    async def async_set_delay_off(self, delay_off_countdown: int) -> None:
+        """Set scheduled off timer in minutes."""
+
+        await self._try_command(
+            "Setting delay off miio device failed.",
+            self._device.delay_off,
+            delay_off_countdown,
+        )
+
+
+class XiaomiFan1C(XiaomiFan):
+    """Representation of a Xiaomi Fan 1C."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._preset_modes = list(FAN_PRESET_MODES_1C)
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+
+        self._oscillate = None
+
+    @property
+    def supported_features(self) -> int:
+        """Supported features."""
+        return (
+            FanEntityFeature.SET_SPEED
+            | FanEntityFeature.PRESET_MODE
+            | FanEntityFeature.OSCILLATE
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.TURN_ON
+        )
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        # On state change the device doesn't provide the new state immediately.
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._oscillate = state.oscillate
+            self._state = state.is_on
+
+            for preset_mode, value in FAN_PRESET_MODES_1C.items():
+                if state.speed == value:
+                    self._preset_mode = preset_mode
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                }
+            )
+            self._retry = 0
+
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    @property
+    def percentage(self) -> int | None:
+        """Return the current speed percentage."""
+        return ordered_list_item_to_percentage(FAN_SPEEDS_1C, self._preset_mode)
+
+    @property
+    def speed_count(self) -> int:
+        """Return the number of speeds the fan supports."""
+        return len(FAN_SPEEDS_1C)
+
+    @property
+    def preset_modes(self):
+        """Get the list of available preset modes."""
+        return self._preset_modes
+
+    @property
+    def preset_mode(self):
+        """Get the current preset mode."""
+        if self._state:
+            return self._preset_mode
+
+        return None
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set the preset mode of the fan."""
+        _LOGGER.debug("Setting the preset mode to: %s", preset_mode)
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+        await self._try_command(
+            "Setting preset mode of the miio device failed.",
+            self._device.set_speed,
+            FAN_PRESET_MODES_1C[preset_mode],
+        )
+
+    async def async_set_percentage(self, percentage: int) -> None:
+        """Set the speed percentage of the fan."""
+        _LOGGER.debug("Setting the fan speed percentage to: %s", percentage)
+
+        if percentage == 0:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+        await self._try_command(
+            "Setting preset mode of the miio device failed.",
+            self._device.set_speed,
+            FAN_PRESET_MODES_1C[
+                percentage_to_ordered_list_item(FAN_SPEEDS_1C, percentage)
+            ],
+        )
+
+    @property
+    def oscillating(self):
+        """Return the oscillation state."""
+        return self._oscillate
+
+    async def async_oscillate(self, oscillating: bool) -> None:
+        """Set oscillation."""
+        if oscillating:
+            await self._try_command(
+                "Setting oscillate on of the miio device failed.",
+                self._device.set_oscillate,
+                True,
+            )
+        else:
+            await self._try_command(
+                "Setting oscillate off of the miio device failed.",
+                self._device.set_oscillate,
+                False,
+            )
+
+    async def async_set_delay_off(self, delay_off_countdown: int) -> None:
+        """Set scheduled off timer in minutes."""
+
+        await self._try_command(
+            "Setting delay off miio device failed.",
+            self._device.delay_off,
+            delay_off_countdown,
+        )
+
+    async def async_set_led_brightness(self, brightness: int = 2):
+        """Set LED on (brightness != 2) or off (brightness == 2)."""
+        if self._device_features & FEATURE_SET_LED == 0:
+            return
+        await self._try_command(
+            "Setting LED of the miio device failed.",
+            self._device.set_led,
+            brightness != 2,
+        )
+
+    async def async_set_natural_mode_on(self):
+        """Turn the natural mode on."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            FanOperationMode.Nature,
+        )
+
+    async def async_set_natural_mode_off(self):
+        """Turn the natural mode off."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            FanOperationMode.Normal,
+        )
+
+
+class XiaomiFanZA5(XiaomiFan):
+    """Representation of a Xiaomi Fan ZA5."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._preset_modes = list(FAN_PRESET_MODES_ZA5)
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+
+    @property
+    def supported_features(self) -> int:
+        """Return supported features."""
+        return (
+            FanEntityFeature.DIRECTION
+            | FanEntityFeature.OSCILLATE
+            | FanEntityFeature.PRESET_MODE
+            | FanEntityFeature.SET_SPEED
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.TURN_ON
+        )
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._percentage = state.fan_speed
+            self._oscillate = state.swing_mode
+            self._natural_mode = state.mode == FanOperationMode.Nature
+            self._state = state.power
+
+            for preset_mode, value in FAN_PRESET_MODES_ZA5.items():
+                if state.fan_level == value:
+                    self._preset_mode = preset_mode
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                    if hasattr(state, value)
+                }
+            )
+            self._retry = 0
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    @property
+    def percentage(self) -> int | None:
+        """Return the current speed as a percentage."""
+        return self._percentage
+
+    @property
+    def speed_count(self) -> int:
+        """Return the number of speeds the fan supports."""
+        return 100
+
+    @property
+    def preset_modes(self):
+        """Return the list of available preset modes."""
+        return self._preset_modes
+
+    @property
+    def preset_mode(self):
+        """Return the current preset mode."""
+        if self._state:
+            return self._preset_mode
+        return None
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set the preset mode of the fan."""
+        _LOGGER.debug("Setting the preset mode to: %s", preset_mode)
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+        await self._try_command(
+            "Setting preset mode of the miio device failed.",
+            self._device.set_speed,
+            FAN_PRESET_MODE_VALUES[preset_mode],
+        )
+
+    async def async_set_percentage(self, percentage: int) -> None:
+        """Set the speed percentage of the fan."""
+        _LOGGER.debug("Setting the fan speed percentage to: %s", percentage)
+
+        if percentage == 0:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+        await self._try_command(
+            "Setting preset mode of the miio device failed.",
+            self._device.set_speed,
+            percentage,
+        )
+
+    async def async_oscillate(self, oscillating: bool) -> None:
+        """Set oscillation."""
+        if oscillating:
+            await self._try_command(
+                "Setting oscillate on of the miio device failed.",
+                self._device.set_oscillate,
+                True,
+            )
+        else:
+            await self._try_command(
+                "Setting oscillate off of the miio device failed.",
+                self._device.set_oscillate,
+                False,
+            )
+
+    async def async_set_delay_off(self, delay_off_countdown: int) -> None:
+        """Set scheduled off timer in minutes."""
+
+        await self._try_command(
+            "Setting delay off miio device failed.",
+            self._device.delay_off,
+            delay_off_countdown * 60,
+        )
+
+    async def async_set_natural_mode_on(self):
+        """Turn the natural mode on."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            FanOperationMode.Nature,
+        )
+
+    async def async_set_natural_mode_off(self):
+        """Turn the natural mode off."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            FanOperationMode.Normal,
+        )
+
+    async def async_set_led_brightness(self, brightness: int = 2):
+        """Set the led brightness."""
+        brightness = FanLedBrightness(brightness)
+        if brightness == FanLedBrightness.Bright:
+            brightness = 100
+        elif brightness == FanLedBrightness.Dim:
+            brightness = 1
+        else:
+            brightness = 0
+        await self.async_set_raw_led_brightness(brightness)
+
+    async def async_set_raw_led_brightness(self, brightness: int):
+        """Set the raw led brightness."""
+        if self._device_features & FEATURE_SET_LED_BRIGHTNESS == 0:
+            return
+
+        await self._try_command(
+            "Setting the led brightness of the miio device failed.",
+            self._device.set_light,
+            brightness,
+        )
+
+    async def async_set_anion_on(self):
+        """Turn anion on."""
+        if self._device_features & FEATURE_SET_ANION == 0:
+            return
+
+        await self._try_command(
+            "Setting anion of the miio device failed.",
+            self._device.set_anion,
+            True,
+        )
+
+    async def async_set_anion_off(self):
+        """Turn anion off."""
+        if self._device_features & FEATURE_SET_ANION == 0:
+            return
+
+        await self._try_command(
+            "Setting anion of the miio device failed.",
+            self._device.set_anion,
+            False,
+        )
+
+
+class OperationModeFanZA5(Enum):
+    """Operation mode enum for FanZA5."""
+
+    Nature = 0
+    Normal = 1
+
+
+class FanStatusZA5(_FanStatusMiot):
+    """Container for status reports for FanZA5."""
+
+    __slots__ = (
+        "anion",
+        "battery_state",
+        "battery_supported",
+        "buttons_pressed",
+        "buzzer",
+        "child_lock",
+        "fan_level",
+        "fan_speed",
+        "humidity",
+        "led",
+        "light",
+        "light_enum",
+        "mode",
+        "power",
+        "power_off_time",
+        "powersupply_attached",
+        "speed_rpm",
+        "swing_mode",
+        "swing_mode_angle",
+        "temperature",
+    )
+
+    _enums = {"mode": OperationModeFanZA5}
+
+    battery_state: str
+    buttons_pressed: str
+    led: bool | None
+    light: int | None
+    light_enum: str
+    powersupply_attached: bool | None
+
+    def _decode(self, data: dict[str, Any], names: Iterable[str]) -> None:
+        """Decode the given fields and derive the dependent ones."""
+        names = tuple(names)
+        super()._decode(data, names)
+
+        if "buttons_pressed" in names:
+            code = data.get("buttons_pressed")
+            if code == 0:
+                self.buttons_pressed = "None"
+            elif code == 1:
+                self.buttons_pressed = "Power"
+            elif code == 2:
+                self.buttons_pressed = "Swing"
+            else:
+                self.buttons_pressed = "Unknown"
+
+        if self.light == 1:
+            brightness = 1
+        elif self.light == 0:
+            brightness = 2
+        else:
+            brightness = 0
+        self.light_enum = FanLedBrightness(brightness).name
+        self.led = None if self.light is None else self.light > 0
+        self.battery_state = "Charging" if self.powersupply_attached else "Discharging"
+
+
+class FanZA5(_MiotDevice):
+    """Main class representing the Xiaomi Fan ZA5 (zhimi.fan.za5)."""
+
+    mapping = {
+        # https://miot-spec.org/miot-spec-v2/instance?type=urn:miot-spec-v2:device:fan:0000A005:zhimi-za5:1
+        "power": {"siid": 2, "piid": 1},
+        "fan_level": {"siid": 2, "piid": 2},
+        "swing_mode": {"siid": 2, "piid": 3},
+        "swing_mode_angle": {"siid": 2, "piid": 5},
+        "mode": {"siid": 2, "piid": 7},
+        "power_off_time": {"siid": 2, "piid": 10},
+        "anion": {"siid": 2, "piid": 11},
+        "child_lock": {"siid": 3, "piid": 1},
+        "light": {"siid": 4, "piid": 3},
+        "buzzer": {"siid": 5, "piid": 1},
+        "buttons_pressed": {"siid": 6, "piid": 1},
+        "battery_supported": {"siid": 6, "piid": 2},
+        "set_move": {"siid": 6, "piid": 3},
+        "speed_rpm": {"siid": 6, "piid": 4},
+        "powersupply_attached": {"siid": 6, "piid": 5},
+        "fan_speed": {"siid": 6, "piid": 8},
+        "humidity": {"siid": 7, "piid": 1},
+        "temperature": {"siid": 7, "piid": 7},
+    }
+
+    def __init__(
+        self,
+        ip: str | None = None,
+        token: str | None = None,
+        start_id: int = 0,
+        debug: int = 0,
+        lazy_discover: bool = True,
+        model: str = MODEL_FAN_ZA5,
+    ) -> None:
+        """Initialize."""
+        super().__init__(ip, token, start_id, debug, lazy_discover, model=model)
+
+    def status(self):
+        """Retrieve properties."""
+        return FanStatusZA5(
+            {
+                prop["did"]: prop["value"] if prop["code"] == 0 else None
+                for prop in self.get_properties_for_mapping()
+            }
+        )
+
+    def on(self):
+        """Power on."""
+        return self.set_property("power", True)
+
+    def off(self):
+        """Power off."""
+        return self.set_property("power", False)
+
+    def set_anion(self, anion: bool):
+        """Set anion on/off."""
+        return self.set_property("anion", anion)
+
+    def set_speed(self, speed: int):
+        """Set fan speed."""
+        if speed < 0 or speed > 100:
+            raise FanException(f"Invalid speed: {speed}")
+
+        return self.set_property("fan_speed", speed)
+
+    def set_angle(self, angle: int):
+        """Set the oscillation angle."""
+        if angle not in [30, 60, 90, 120]:
+            raise FanException(
+                "Unsupported angle. Supported values: "
+                + ", ".join(f"{i}" for i in [30, 60, 90, 120])
+            )
+
+        return self.set_property("swing_mode_angle", angle)
+
+    def set_oscillate(self, oscillate: bool):
+        """Set oscillate on/off."""
+        if oscillate:
+            return self.set_property("swing_mode", True)
+        else:
+            return self.set_property("swing_mode", False)
+
+    def set_buzzer(self, buzzer: bool):
+        """Set buzzer on/off."""
+        if buzzer:
+            return self.set_property("buzzer", True)
+        else:
+            return self.set_property("buzzer", False)
+
+    def set_child_lock(self, lock: bool):
+        """Set child lock on/off."""
+        return self.set_property("child_lock", lock)
+
+    def set_light(self, light: int):
+        """Set indicator brightness."""
+        if light < 0 or light > 100:
+            raise FanException(f"Invalid light: {light}")
+
+        return self.set_property("light", light)
+
+    def set_mode(self, mode: FanOperationMode):
+        """Set mode."""
+        return self.set_property("mode", OperationModeFanZA5[mode.name].value)
+
+    def delay_off(self, seconds: int):
+        """Set delay off seconds."""
+
+        if seconds < 0 or seconds > 10 * 60 * 60:
+            raise FanException(f"Invalid value for a delayed turn off: {seconds}")
+
+        return self.set_property("power_off_time", seconds)
+
+    def set_rotate(self, direction: FanMoveDirection):
+        """Rotate fan 7.5 degrees horizontally to given direction."""
+        return self.set_property("set_move", direction.name.lower())
+
+
+class XiaomiFanP33(XiaomiFanMiot):
+    """Representation of a Xiaomi Fan P33."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._percentage = None
+        self._preset_modes = list(FAN_PRESET_MODES_P33)
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+
+        self._preset_mode = None
+        self._oscillate = None
+        self._natural_mode = False
+
+    @property
+    def supported_features(self) -> int:
+        """Return supported features."""
+        return (
+            FanEntityFeature.DIRECTION
+            | FanEntityFeature.OSCILLATE
+            | FanEntityFeature.PRESET_MODE
+            | FanEntityFeature.SET_SPEED
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.TURN_ON
+        )
+
+    """
+    TODO:
+    - setting child lock works, but HA always reads the value as null
+    """
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._percentage = state.percentage
+            self._oscillate = state.oscillate
+            self._natural_mode = state.mode == OperationModeFanP33.Nature
+            self._state = state.power
+
+            for preset_mode, value in FAN_PRESET_MODES_P33.items():
+                if state.fan_level == value:
+                    self._preset_mode = preset_mode
+                    break
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                    if hasattr(state, value)
+                }
+            )
+            self._retry = 0
+
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    @property
+    def percentage(self) -> int | None:
+        """Return the current speed as a percentage."""
+        return self._percentage
+
+    @property
+    def preset_modes(self):
+        """Return the list of available preset modes."""
+        return self._preset_modes
+
+    @property
+    def preset_mode(self):
+        """Return the current preset mode."""
+        if self._state:
+            return self._preset_mode
+        return None
+
+    async def async_set_natural_mode_on(self):
+        """Turn the natural mode on."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanP33.Nature,
+        )
+
+    async def async_set_natural_mode_off(self):
+        """Turn the natural mode off."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanP33.Normal,
+        )
+
+
+class OperationModeFanP33(Enum):
+    """Operation mode enum for FanP33."""
+
+    Normal = 0
+    Nature = 1
+
+
+class FanStatusP33(_FanStatusMiot):
+    """Container for status reports for FanP33.
+
+    Initialized with a response from Fan (dmaker.fan.p33, fw: 2.1.3):
+
+    {'did': 'power', 'siid': 2, 'piid': 1, 'code': 0, 'value': True},
+    {'did': 'fan_level', 'siid': 2, 'piid': 2, 'code': 0, 'value': 1},
+    {'did': 'swing_mode', 'siid': 2, 'piid': 4, 'code': 0, 'value': False},
+    {'did': 'swing_mode_angle', 'siid': 2, 'piid': 5, 'code': 0, 'value': 120},
+    {'did': 'mode', 'siid': 2, 'piid': 3, 'code': 0, 'value': 1},
+    {'did': 'power_off_time', 'siid': 3, 'piid': 1, 'code': 0, 'value': 0},
+    {'did': 'child_lock', 'siid': 7, 'piid': 1, 'code': 0, 'value': False},
+    {'did': 'light', 'siid': 4, 'piid': 1, 'code': 0, 'value': True},
+    {'did': 'buzzer', 'siid': 5, 'piid': 1, 'code': 0, 'value': True},
+    {'did': 'set_move', 'siid': 6, 'piid': 1, 'code': -4003},
+    {'did': 'fan_speed', 'siid': 2, 'piid': 6, 'code': 0, 'value': 20},
+    """
+
+    __slots__ = (
+        "angle",
+        "buzzer",
+        "child_lock",
+        "delay_off_countdown",
+        "fan_level",
+        "led",
+        "light",
+        "mode",
+        "oscillate",
+        "percentage",
+        "power",
+    )
+
+    _enums = {"mode": OperationModeFanP33}
+    _aliases = {
+        "percentage": "fan_speed",
+        "led": "light",
+        "delay_off_countdown": "power_off_time",
+        "oscillate": "swing_mode",
+        "angle": "swing_mode_angle",
+    }
+
+
+class FanP33(_MiotDevice):
+    """Main class representing the Xiaomi Fan P33 (dmaker.fan.p33)."""
+
+    mapping = {
+        # https://miot-spec.org/miot-spec-v2/instance?type=urn:miot-spec-v2:device:fan:0000A005:dmaker-p33:1
+        "power": {"siid": 2, "piid": 1},
+        "fan_level": {"siid": 2, "piid": 2},
+        "swing_mode": {"siid": 2, "piid": 4},
+        "swing_mode_angle": {"siid": 2, "piid": 5},
+        "mode": {"siid": 2, "piid": 3},
+        "power_off_time": {"siid": 3, "piid": 1},
+        "child_lock": {"siid": 7, "piid": 1},
+        "light": {"siid": 4, "piid": 1},
+        "buzzer": {"siid": 5, "piid": 1},
+        "set_move": {"siid": 6, "piid": 1},
+        "fan_speed": {"siid": 2, "piid": 6},
+    }
+
+    def __init__(
+        self,
+        ip: str | None = None,
+        token: str | None = None,
+        start_id: int = 0,
+        debug: int = 0,
+        lazy_discover: bool = True,
+        model: str = MODEL_FAN_P33,
+    ) -> None:
+        """Initialize."""
+        super().__init__(ip, token, start_id, debug, lazy_discover, model=model)
+
+    def status(self):
+        """Retrieve properties."""
+        return FanStatusP33(
+            {
+                prop["did"]: prop["value"] if prop["code"] == 0 else None
+                for prop in self.get_properties_for_mapping()
+            }
+        )
+
+    def on(self):
+        """Power on."""
+        return self.set_property("power", True)
+
+    def off(self):
+        """Power off."""
+        return self.set_property("power", False)
+
+    def set_speed(self, speed: int):
+        """Set fan speed, needed to wrap next method."""
+        return self.set_percentage(speed)
+
+    def set_percentage(self, percentage: int):
+        """Set fan percentage."""
+        if percentage < 0 or percentage > 100:
+            raise FanException(f"Invalid percentage: {percentage}")
+
+        return self.set_property("fan_speed", percentage)
+
+    def set_angle(self, angle: int):
+        """Set the oscillation angle."""
+        if angle not in [30, 60, 90, 120, 140]:
+            raise FanException(
+                "Unsupported angle. Supported values: "
+                + ", ".join(f"{i}" for i in [30, 60, 90, 120, 140])
+            )
+
+        return self.set_property("swing_mode_angle", angle)
+
+    def set_oscillate(self, oscillate: bool):
+        """Set oscillate on/off."""
+        if oscillate:
+            return self.set_property("swing_mode", True)
+        else:
+            return self.set_property("swing_mode", False)
+
+    def set_buzzer(self, buzzer: bool):
+        """Set buzzer on/off."""
+        if buzzer:
+            return self.set_property("buzzer", True)
+        else:
+            return self.set_property("buzzer", False)
+
+    def set_child_lock(self, lock: bool):
+        """Set child lock on/off."""
+        self.status()
+        return self.set_property("child_lock", lock)
+
+    def set_light(self, light: bool):
+        """Set indicator state."""
+        return self.set_property("light", light)
+
+    def set_mode(self, mode: OperationModeFanP33):
+        """Set mode."""
+        return self.set_property("mode", OperationModeFanP33[mode.name].value)
+
+    def delay_off(self, minutes: int):
+        """Set delay off minutes."""
+
+        if minutes < 0 or minutes > 480:
+            raise FanException(f"Invalid value for a delayed turn off: {minutes}")
+
+        return self.set_property("power_off_time", minutes)
+
+    def set_rotate(self, direction: FanMoveDirection):
+        """Rotate fan 7.5 degrees horizontally to given direction."""
+        # Values for P33
+        # { "value": 0, "description": "NONE" },
+        # { "value": 1, "description": "LEFT" },
+        # { "value": 2, "description": "RIGHT" }
+        value = 0
+        if direction == FanMoveDirection.Left:
+            value = 1
+        elif direction == FanMoveDirection.Right:
+            value = 2
+        return self.set_property("set_move", value)
+
+
+class XiaomiFanP39(XiaomiFanMiot):
+    """Representation of a Xiaomi Fan P39."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._percentage = None
+        self._preset_modes = list(FAN_PRESET_MODES_P39)
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+
+        self._preset_mode = None
+        self._oscillate = None
+        self._natural_mode = False
+
+    @property
+    def supported_features(self) -> int:
+        """Return supported features."""
+        return (
+            FanEntityFeature.DIRECTION
+            | FanEntityFeature.OSCILLATE
+            | FanEntityFeature.PRESET_MODE
+            | FanEntityFeature.SET_SPEED
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.TURN_ON
+        )
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._percentage = state.fan_speed
+            self._oscillate = state.oscillate
+            self._natural_mode = state.mode == OperationModeFanP39.Nature
+            self._state = state.power
+
+            for preset_mode, value in FAN_PRESET_MODES_P39.items():
+                if state.fan_level == value:
+                    self._preset_mode = preset_mode
+                    break
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                    if hasattr(state, value)
+                }
+            )
+            self._retry = 0
+
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    @property
+    def percentage(self) -> int | None:
+        """Return the current speed as a percentage."""
+        return self._percentage
+
+    @property
+    def preset_modes(self):
+        """Return the list of available preset modes."""
+        return self._preset_modes
+
+    @property
+    def preset_mode(self):
+        """Return the current preset mode."""
+        if self._state:
+            return self._preset_mode
+        return None
+
+    async def async_set_natural_mode_on(self):
+        """Turn the natural mode on."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanP39.Nature,
+        )
+
+    async def async_set_natural_mode_off(self):
+        """Turn the natural mode off."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanP39.Normal,
+        )
+
+
+class OperationModeFanP39(Enum):
+    """Operation mode enum for FanP39."""
+
+    Normal = 0
+    Nature = 1
+    Sleep = 2
+
+
+class FanStatusP39(_FanStatusMiot):
+    """Container for status reports for FanP39."""
+
+    __slots__ = (
+        "angle",
+        "child_lock",
+        "delay_off_countdown",
+        "fan_level",
+        "fan_speed",
+        "mode",
+        "oscillate",
+        "power",
+    )
+
+    _enums = {"mode": OperationModeFanP39}
+    _aliases = {
+        "delay_off_countdown": "power_off_time",
+        "oscillate": "swing_mode",
+        "angle": "swing_mode_angle",
+    }
+
+
+class FanP39(_MiotDevice):
+    """Main class representing the Xiaomi Fan P39 (dmaker.fan.p39)."""
+
+    mapping = {
+        # https://miot-spec.org/miot-spec-v2/instance?type=urn:miot-spec-v2:device:fan:0000A005:dmaker-p39:1
+        "power": {"siid": 2, "piid": 1},
+        "fan_level": {"siid": 2, "piid": 2},
+        "mode": {"siid": 2, "piid": 4},
+        "swing_mode": {"siid": 2, "piid": 5},
+        "swing_mode_angle": {"siid": 2, "piid": 6},
+        "power_off_time": {"siid": 2, "piid": 8},
+        "set_move": {"siid": 2, "piid": 10, "access": ["write"]},
+        "fan_speed": {"siid": 2, "piid": 11},
+        "child_lock": {"siid": 3, "piid": 1},
+    }
+
+    def __init__(
+        self,
+        ip: str | None = None,
+        token: str | None = None,
+        start_id: int = 0,
+        debug: int = 0,
+        lazy_discover: bool = True,
+        model: str = MODEL_FAN_P39,
+    ) -> None:
+        """Initialize."""
+        super().__init__(ip, token, start_id, debug, lazy_discover, model=model)
+
+    # backported and adapted from current master
+    def get_properties_for_mapping(self, *, max_properties=15) -> list:
+        """Retrieve raw properties based on mapping."""
+        mapping = self._get_mapping()
+
+        # We send property key in "did" because it's sent back via response and we can identify the property.
+        properties = [
+            {"did": k, **_filter_request_fields(v)}
+            for k, v in mapping.items()
+            if "aiid" not in v and ("access" not in v or "read" in v["access"])
+        ]
+
+        return self.get_properties(
+            properties, property_getter="get_properties", max_properties=max_properties
+        )
+
+    def status(self):
+        """Retrieve properties."""
+        return FanStatusP39(
+            {
+                prop["did"]: prop["value"] if prop["code"] == 0 else None
+                for prop in self.get_properties_for_mapping()
+            }
+        )
+
+    def on(self):
+        """Power on."""
+        return self.set_property("power", True)
+
+    def off(self):
+        """Power off."""
+        return self.set_property("power", False)
+
+    def set_speed(self, speed: int):
+        """Set fan speed."""
+        if speed < 0 or speed > 100:
+            raise FanException(f"Invalid speed: {speed}")
+
+        return self.set_property("fan_speed", speed)
+
+    def set_angle(self, angle: int):
+        """Set the oscillation angle."""
+        if angle not in [30, 60, 90, 120, 140]:
+            raise FanException(
+                "Unsupported angle. Supported values: "
+                + ", ".join(f"{i}" for i in [30, 60, 90, 120, 140])
+            )
+
+        return self.set_property("swing_mode_angle", angle)
+
+    def set_oscillate(self, oscillate: bool):
+        """Set oscillate on/off."""
+        if oscillate:
+            return self.set_property("swing_mode", True)
+        else:
+            return self.set_property("swing_mode", False)
+
+    def set_child_lock(self, lock: bool):
+        """Set child lock on/off."""
+        self.status()
+        return self.set_property("child_lock", lock)
+
+    def set_mode(self, mode: OperationModeFanP39):
+        """Set mode."""
+        return self.set_property("mode", OperationModeFanP39[mode.name].value)
+
+    def delay_off(self, minutes: int):
+        """Set delay off minutes."""
+
+        if minutes < 0 or minutes > 480:
+            raise FanException(f"Invalid value for a delayed turn off: {minutes}")
+
+        return self.set_property("power_off_time", minutes)
+
+    def set_rotate(self, direction: FanMoveDirection):
+        """Rotate fan 7.5 degrees horizontally to given direction."""
+        # Values for P39
+        # { "value": 0, "description": "None" },
+        # { "value": 1, "description": "Left" },
+        # { "value": 2, "description": "Right" }
+        value = 0
+        if direction == FanMoveDirection.Left:
+            value = 1
+        elif direction == FanMoveDirection.Right:
+            value = 2
+        return self.set_property("set_move", value)
+
+
+class OperationModeFanP45(Enum):
+    """Operating modes for the Xiaomi Smart Tower Fan 2 (xiaomi.fan.p45)."""
+
+    Straight = 0
+    Natural = 1
+    Sleep = 2
+
+
+# Implemented against the canonical xiaomi.fan.p45 MIoT spec instance
+# urn:miot-spec-v2:device:fan:0000A005:xiaomi-p45:1:0000D062 (the bare
+# ``:1`` URN is not registered on miot-spec.org; only the full instance
+# with the ``:0000D062`` suffix resolves). The CN counterpart reports as
+# dmaker.fan.p45 and uses a different profile, so this spec is
+# intentionally only registered for the xiaomi.fan.p45 model string.
+# Region-locked firmware may reject some of the angles at runtime.
+MIOT_SPEC_FAN_P45 = MiotFanSpec(
+    name="P45",
+    model=MODEL_FAN_P45,
+    modes=OperationModeFanP45,
+    properties={
+        "power": (2, 1),
+        "fault": (2, 2),
+        "mode": (2, 3),
+        "fan_level": (2, 4),
+        "fan_speed": (2, 5),
+        "horizontal_swing": (2, 6),
+        "horizontal_swing_angle": (2, 7),
+        "led": (5, 1),
+        "buzzer": (7, 1),
+        "child_lock": (11, 1),
+        "delay": (12, 1),
+        "delay_time": (12, 2),
+        "delay_remain_time": (12, 3),
+    },
+    actions={"turn_left": (2, 4), "turn_right": (2, 5)},
+    read_only=frozenset({"fault"}),
+    angles=(30, 60, 90, 120, 150),
+    delay_switch=True,
+)
+
+
+class XiaomiFanP45(XiaomiFanMiot):
+    """Representation of the Xiaomi Smart Tower Fan 2 (xiaomi.fan.p45)."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._percentage = None
+        self._preset_modes = list(FAN_PRESET_MODES_P45)
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+
+        self._preset_mode = None
+        self._oscillate = None
+        self._natural_mode = False
+
+    @property
+    def supported_features(self) -> int:
+        """Return supported features."""
+        return (
+            FanEntityFeature.OSCILLATE
+            | FanEntityFeature.PRESET_MODE
+            | FanEntityFeature.SET_SPEED
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.TURN_ON
+        )
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._percentage = state.fan_speed
+            self._oscillate = state.horizontal_swing
+            self._natural_mode = state.mode == OperationModeFanP45.Natural.name
+            self._state = state.power
+
+            if state.mode == OperationModeFanP45.Sleep.name:
+                self._preset_mode = FAN_PRESET_MODE_SLEEP
+            else:
+                self._preset_mode = None
+                for preset_mode, value in FAN_PRESET_MODES_P45.items():
+                    if preset_mode in (SPEED_OFF, FAN_PRESET_MODE_SLEEP):
+                        continue
+                    is_natural = preset_mode.startswith("Natural")
+                    if state.fan_level == value and is_natural == self._natural_mode:
+                        self._preset_mode = preset_mode
+                        break
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                    if hasattr(state, value)
+                }
+            )
+            self._retry = 0
+
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    @property
+    def percentage(self):
+        """Return the current percentage."""
+        return self._percentage
+
+    @property
+    def preset_modes(self):
+        """Return the list of available preset modes."""
+        return self._preset_modes
+
+    @property
+    def preset_mode(self):
+        """Return the current preset mode."""
+        if self._state:
+            return self._preset_mode
+        return None
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set preset mode.
+
+        Combines level (1..4) with Straight/Natural mode, or selects standalone Sleep mode.
+        """
+        _LOGGER.debug("Setting the preset mode to: %s", preset_mode)
+
+        if preset_mode == SPEED_OFF:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+
+        if preset_mode == FAN_PRESET_MODE_SLEEP:
+            await self._try_command(
+                "Setting fan mode failed.",
+                self._device.set_mode,
+                OperationModeFanP45.Sleep,
+            )
+            return
+
+        natural = preset_mode.startswith("Natural")
+        await self._try_command(
+            "Setting fan mode failed.",
+            self._device.set_mode,
+            OperationModeFanP45.Natural if natural else OperationModeFanP45.Straight,
+        )
+        await self._try_command(
+            "Setting fan level of the miio device failed.",
+            self._device.set_fan_level,
+            FAN_PRESET_MODES_P45[preset_mode],
+        )
+
+    async def async_set_percentage(self, percentage: int) -> None:
+        """Set the speed percentage of the fan."""
+        _LOGGER.debug("Setting the fan speed percentage to: %s", percentage)
+
+        if percentage == 0:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+
+        await self._try_command(
+            "Setting fan speed percentage of the miio device failed.",
+            self._device.set_speed,
+            percentage,
+        )
+
+    async def async_set_natural_mode_on(self):
+        """Turn the natural mode on."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanP45.Natural,
+        )
+
+    async def async_set_natural_mode_off(self):
+        """Turn the natural mode off."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanP45.Straight,
+        )
+
+    async def async_turn(
+        self, direction: str, steps: int = 1, angle: float | None = None
+    ):
+        """Turn fan in the given direction by a number of steps or an angle."""
+        if self._device_features & FEATURE_TURN == 0:
+            return
+        if angle is not None:
+            steps = max(round(angle / TURN_STEP_ANGLE), 1)
+        await self._try_command(
+            "Turning the miio device failed.",
+            self._device.turn,
+            direction,
+            steps,
+        )
+
+
+class OperationModeFanP76(Enum):
+    """Operation mode enum for FanP76."""
+
+    Straight = 0
+    Natural = 1
+
+
+# urn:miot-spec-v2:device:fan:0000A005:xiaomi-p76:1
+MIOT_SPEC_FAN_P76 = MiotFanSpec(
+    name="P76",
+    model=MODEL_FAN_P76,
+    modes=OperationModeFanP76,
+    properties={
+        "power": (2, 1),
+        "fault": (2, 2),
+        "mode": (2, 3),
+        "fan_level": (2, 4),
+        "fan_speed": (2, 5),
+        "horizontal_swing": (2, 6),
+        "horizontal_swing_angle": (2, 7),
+        "vertical_swing": (2, 8),
+        "vertical_swing_angle": (2, 9),
+        "led": (5, 1),
+        "buzzer": (7, 1),
+        "child_lock": (8, 1),
+        "delay": (9, 1),
+        "delay_time": (9, 2),
+        "delay_remain_time": (9, 4),
+    },
+    actions={
+        "turn_left": (2, 4),
+        "turn_right": (2, 5),
+        "turn_up": (2, 6),
+        "turn_down": (2, 7),
+    },
+    fan_levels=range(4),
+    angles=(30, 60, 90, 120),
+    vertical_angles=(30, 60, 90, 100),
+)
+
+
+class XiaomiFanP76(XiaomiFanP33):
+    """Representation of a Xiaomi Fan P76."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._percentage = None
+        self._preset_modes = list(FAN_PRESET_MODES_P76)
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+
+        self._preset_mode = None
+        self._oscillate = None
+        self._vertical_oscillate = None
+        self._natural_mode = False
+
+    @property
+    def supported_features(self) -> int:
+        """Return supported features."""
+        return (
+            FanEntityFeature.OSCILLATE
+            | FanEntityFeature.PRESET_MODE
+            | FanEntityFeature.SET_SPEED
+            | FanEntityFeature.DIRECTION
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.TURN_ON
+        )
+
+    @property
+    def current_direction(self) -> str | None:
+        """Return the current direction."""
+        if self._vertical_oscillate is None:
+            return None
+        return "forward" if self._vertical_oscillate else "reverse"
+
+    async def async_set_direction(self, direction: str) -> None:
+        """Set the fan direction."""
+        if direction == "forward":
+            await self.async_set_vertical_oscillation_on()
+            self._vertical_oscillate = True
+        else:
+            await self.async_set_vertical_oscillation_off()
+            self._vertical_oscillate = False
+        self.async_write_ha_state()
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._percentage = state.fan_speed
+            self._oscillate = state.horizontal_swing
+            self._vertical_oscillate = state.vertical_swing
+            self._natural_mode = state.mode == OperationModeFanP76.Natural.name
+            self._state = state.power
+
+            for preset_mode, value in FAN_PRESET_MODES_P76.items():
+                if preset_mode == SPEED_OFF:
+                    continue
+                is_natural = preset_mode.startswith("Natural")
+                if state.fan_level == value and is_natural == self._natural_mode:
+                    self._preset_mode = preset_mode
+                    break
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                    if hasattr(state, value)
+                }
+            )
+            self._retry = 0
+
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set the preset mode of the fan."""
+        _LOGGER.debug("Setting the preset mode to: %s", preset_mode)
+
+        if preset_mode == SPEED_OFF:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+
+        natural = preset_mode.startswith("Natural")
+        await self._try_command(
+            "Setting fan mode failed.",
+            self._device.set_mode,
+            OperationModeFanP76.Natural if natural else OperationModeFanP76.Straight,
+        )
+        await self._try_command(
+            "Setting fan level of the miio device failed.",
+            self._device.set_fan_level,
+            FAN_PRESET_MODES_P76[preset_mode],
+        )
+
+    async def async_set_percentage(self, percentage: int) -> None:
+        """Set the speed percentage of the fan."""
+        _LOGGER.debug("Setting the fan speed percentage to: %s", percentage)
+
+        if percentage == 0:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+        await self._try_command(
+            "Setting fan speed percentage of the miio device failed.",
+            self._device.set_speed,
+            percentage,
+        )
+
+    async def async_set_natural_mode_on(self):
+        """Turn the natural mode on."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanP76.Natural,
+        )
+
+    async def async_set_natural_mode_off(self):
+        """Turn the natural mode off."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanP76.Straight,
+        )
+
+    async def async_set_led_brightness(self, brightness: int = 2):
+        """Set LED on (brightness != 2) or off (brightness == 2)."""
+        if self._device_features & FEATURE_SET_LED == 0:
+            return
+        await self._try_command(
+            "Setting LED of the miio device failed.",
+            self._device.set_light,
+            brightness != 2,
+        )
+
+    async def async_set_vertical_oscillation_on(self):
+        """Turn vertical oscillation on."""
+        if self._device_features & FEATURE_SET_VERTICAL_OSCILLATION == 0:
+            return
+        await self._try_command(
+            "Setting vertical oscillation on of the miio device failed.",
+            self._device.set_vertical_oscillate,
+            True,
+        )
+
+    async def async_set_vertical_oscillation_off(self):
+        """Turn vertical oscillation off."""
+        if self._device_features & FEATURE_SET_VERTICAL_OSCILLATION == 0:
+            return
+        await self._try_command(
+            "Setting vertical oscillation off of the miio device failed.",
+            self._device.set_vertical_oscillate,
+            False,
+        )
+
+    async def async_turn(
+        self, direction: str, steps: int = 1, angle: float | None = None
+    ):
+        """Turn fan in the given direction by a number of steps or an angle."""
+        if self._device_features & FEATURE_TURN == 0:
+            return
+        if angle is not None:
+            steps = max(round(angle / TURN_STEP_ANGLE), 1)
+        await self._try_command(
+            "Turning the miio device failed.",
+            self._device.turn,
+            direction,
+            steps,
+        )
+
+
+class OperationModeFanXiaomiP30(Enum):
+    """Operation mode enum for FanXiaomiP30."""
+
+    Normal = 0
+    Nature = 1
+
+
+# https://miot-spec.org/miot-spec-v2/instance?type=urn:miot-spec-v2:device:fan:0000A005:xiaomi-p30:1:0000D062
+MIOT_SPEC_FAN_XIAOMI_P30 = MiotFanSpec(
+    name="XiaomiP30",
+    model=MODEL_FAN_XIAOMI_P30,
+    modes=OperationModeFanXiaomiP30,
+    properties={
+        "power": (2, 1),
+        "fault": (2, 2),
+        "mode": (2, 3),
+        "fan_level": (2, 4),
+        "fan_speed": (2, 5),
+        "horizontal_swing": (2, 6),
+        "horizontal_swing_angle": (2, 7),
+        "led": (5, 1),
+        "buzzer": (7, 1),
+        "child_lock": (8, 1),
+        "delay": (9, 1),
+        "delay_time": (9, 2),
+        "delay_remain_time": (9, 4),
+    },
+    actions={"turn_left": (2, 4), "turn_right": (2, 5)},
+    aliases={
+        "percentage": "fan_speed",
+        "oscillate": "horizontal_swing",
+        "angle": "horizontal_swing_angle",
+    },
+    angles=(30, 60, 90, 120, 140),
+)
+
+
+class XiaomiFanXiaomiP30(XiaomiFanP33):
+    """Representation of the Xiaomi Fan P30 (xiaomi.fan.p30)."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._percentage = None
+        self._preset_modes = list(FAN_PRESET_MODES_XIAOMI_P30)
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+
+        self._preset_mode = None
+        self._oscillate = None
+        self._natural_mode = False
+
+    @property
+    def supported_features(self) -> int:
+        """Return supported features."""
+        return (
+            FanEntityFeature.OSCILLATE
+            | FanEntityFeature.PRESET_MODE
+            | FanEntityFeature.SET_SPEED
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.TURN_ON
+        )
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._percentage = state.fan_speed
+            self._oscillate = state.horizontal_swing
+            self._natural_mode = state.mode == OperationModeFanXiaomiP30.Nature.name
+            self._state = state.power
+
+            for preset_mode, value in FAN_PRESET_MODES_XIAOMI_P30.items():
+                if preset_mode == SPEED_OFF:
+                    continue
+                is_natural = preset_mode.startswith("Natural")
+                if state.fan_level == value and is_natural == self._natural_mode:
+                    self._preset_mode = preset_mode
+                    break
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                    if hasattr(state, value)
+                }
+            )
+            self._retry = 0
+
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set the preset mode of the fan."""
+        _LOGGER.debug("Setting the preset mode to: %s", preset_mode)
+
+        if preset_mode == SPEED_OFF:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+
+        natural = preset_mode.startswith("Natural")
+        await self._try_command(
+            "Setting fan mode failed.",
+            self._device.set_mode,
+            OperationModeFanXiaomiP30.Nature
+            if natural
+            else OperationModeFanXiaomiP30.Normal,
+        )
+        await self._try_command(
+            "Setting fan level of the miio device failed.",
+            self._device.set_fan_level,
+            FAN_PRESET_MODES_XIAOMI_P30[preset_mode],
+        )
+
+    async def async_set_percentage(self, percentage: int) -> None:
+        """Set the speed percentage of the fan."""
+        _LOGGER.debug("Setting the fan speed percentage to: %s", percentage)
+
+        if percentage == 0:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+        await self._try_command(
+            "Setting fan speed percentage of the miio device failed.",
+            self._device.set_speed,
+            percentage,
+        )
+
+    async def async_set_natural_mode_on(self):
+        """Turn the natural mode on."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanXiaomiP30.Nature,
+        )
+
+    async def async_set_natural_mode_off(self):
+        """Turn the natural mode off."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanXiaomiP30.Normal,
+        )
+
+    async def async_set_led_brightness(self, brightness: int = 2):
+        """Set LED on (brightness != 2) or off (brightness == 2)."""
+        if self._device_features & FEATURE_SET_LED == 0:
+            return
+        await self._try_command(
+            "Setting LED of the miio device failed.",
+            self._device.set_light,
+            brightness != 2,
+        )
+
+    async def async_turn(
+        self, direction: str, steps: int = 1, angle: float | None = None
+    ):
+        """Turn fan in the given direction by a number of steps or an angle."""
+        if self._device_features & FEATURE_TURN == 0:
+            return
+        if angle is not None:
+            steps = max(round(angle / TURN_STEP_ANGLE), 1)
+        await self._try_command(
+            "Turning the miio device failed.",
+            self._device.turn,
+            direction,
+            steps,
+        )
+
+
+class OperationModeFanP70(Enum):
+    """Operation mode enum for FanP70."""
+
+    Straight = 0
+    Natural = 1
+
+
+# https://miot-spec.org/miot-spec-v2/instance?type=urn:miot-spec-v2:device:fan:0000A005:xiaomi-p70:1:0000D062
+MIOT_SPEC_FAN_P70 = MiotFanSpec(
+    name="P70",
+    model=MODEL_FAN_P70,
+    modes=OperationModeFanP70,
+    properties={
+        "power": (2, 1),
+        "fault": (2, 2),
+        "mode": (2, 3),
+        "fan_level": (2, 4),
+        "fan_speed": (2, 5),
+        "horizontal_swing": (2, 6),
+        "horizontal_swing_angle": (2, 7),
+        "vertical_swing": (2, 8),
+        "vertical_swing_angle": (2, 9),
+        "led": (5, 1),
+        "buzzer": (7, 1),
+        "child_lock": (8, 1),
+        "delay_time": (9, 2),
+    },
+    actions={
+        "turn_left": (2, 4),
+        "turn_right": (2, 5),
+        "turn_up": (2, 6),
+        "turn_down": (2, 7),
+    },
+    fan_levels=range(4),
+    angles=(30, 60, 90, 120),
+    vertical_angles=(30, 60, 90, 100),
+)
+
+
+class XiaomiFanP70(XiaomiFanP33):
+    """Representation of a Xiaomi Smart Desktop Air Circulation Fan P70."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._percentage = None
+        self._preset_modes = list(FAN_PRESET_MODES_P70)
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+
+        self._preset_mode = None
+        self._oscillate = None
+        self._vertical_oscillate = None
+        self._natural_mode = False
+
+    @property
+    def supported_features(self) -> int:
+        """Return supported features."""
+        return (
+            FanEntityFeature.OSCILLATE
+            | FanEntityFeature.PRESET_MODE
+            | FanEntityFeature.SET_SPEED
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.TURN_ON
+            | FanEntityFeature.DIRECTION
+        )
+
+    @property
+    def current_direction(self) -> str | None:
+        """Return the current direction."""
+        if self._vertical_oscillate is None:
+            return None
+        return "forward" if self._vertical_oscillate else "reverse"
+
+    async def async_set_direction(self, direction: str) -> None:
+        """Set the fan direction."""
+        if direction == "forward":
+            await self.async_set_vertical_oscillation_on()
+            self._vertical_oscillate = True
+        else:
+            await self.async_set_vertical_oscillation_off()
+            self._vertical_oscillate = False
+        self.async_write_ha_state()
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._percentage = state.fan_speed
+            self._oscillate = state.horizontal_swing
+            self._vertical_oscillate = state.vertical_swing
+            self._natural_mode = state.mode == OperationModeFanP70.Natural.name
+            self._state = state.power
+
+            for preset_mode, value in FAN_PRESET_MODES_P70.items():
+                if state.fan_level == value:
+                    self._preset_mode = preset_mode
+                    break
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                    if hasattr(state, value)
+                }
+            )
+            self._retry = 0
+
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set the preset mode of the fan."""
+        _LOGGER.debug("Setting the preset mode to: %s", preset_mode)
+
+        if preset_mode == SPEED_OFF:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+        await self._try_command(
+            "Setting fan level of the miio device failed.",
+            self._device.set_fan_level,
+            FAN_PRESET_MODES_P70[preset_mode],
+        )
+
+    async def async_set_percentage(self, percentage: int) -> None:
+        """Set the speed percentage of the fan."""
+        _LOGGER.debug("Setting the fan speed percentage to: %s", percentage)
+
+        if percentage == 0:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+        await self._try_command(
+            "Setting fan speed percentage of the miio device failed.",
+            self._device.set_speed,
+            percentage,
+        )
+
+    async def async_set_natural_mode_on(self):
+        """Turn the natural mode on."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanP70.Natural,
+        )
+
+    async def async_set_natural_mode_off(self):
+        """Turn the natural mode off."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanP70.Straight,
+        )
+
+    async def async_set_led_brightness(self, brightness: int = 2):
+        """Set LED on (brightness != 2) or off (brightness == 2)."""
+        if self._device_features & FEATURE_SET_LED == 0:
+            return
+        await self._try_command(
+            "Setting LED of the miio device failed.",
+            self._device.set_light,
+            brightness != 2,
+        )
+
+    async def async_set_vertical_oscillation_on(self):
+        """Turn vertical oscillation on."""
+        if self._device_features & FEATURE_SET_VERTICAL_OSCILLATION == 0:
+            return
+        await self._try_command(
+            "Setting vertical oscillation on of the miio device failed.",
+            self._device.set_vertical_oscillate,
+            True,
+        )
+
+    async def async_set_vertical_oscillation_off(self):
+        """Turn vertical oscillation off."""
+        if self._device_features & FEATURE_SET_VERTICAL_OSCILLATION == 0:
+            return
+        await self._try_command(
+            "Setting vertical oscillation off of the miio device failed.",
+            self._device.set_vertical_oscillate,
+            False,
+        )
+
+    async def async_turn(
+        self, direction: str, steps: int = 1, angle: float | None = None
+    ):
+        """Turn fan in the given direction by a number of steps or an angle."""
+        if self._device_features & FEATURE_TURN == 0:
+            return
+        if angle is not None:
+            steps = max(round(angle / TURN_STEP_ANGLE), 1)
+        await self._try_command(
+            "Turning the miio device failed.",
+            self._device.turn,
+            direction,
+            steps,
+        )
+
+
+class OperationModeFan2Lite(Enum):
+    """Operation mode enum for Fan2Lite."""
+
+    Straight = 0
+    Natural = 1
+
+
+# urn:miot-spec-v2:device:fan:0000A005:xiaomi-2lite:1
+MIOT_SPEC_FAN_2LITE = MiotFanSpec(
+    name="2Lite",
+    model=MODEL_FAN_2LITE,
+    modes=OperationModeFan2Lite,
+    properties={
+        "power": (2, 1),
+        "fault": (2, 2),
+        "mode": (2, 3),
+        "fan_level": (2, 4),
+        "horizontal_swing": (2, 6),
+        "led": (5, 1),
+        "buzzer": (7, 1),
+        "child_lock": (8, 1),
+        "delay": (9, 1),
+        "delay_time": (9, 2),
+    },
+    fan_levels=range(FAN_2LITE_SPEED_COUNT),
+    delay_switch=True,
+)
+
+
+class XiaomiFan2Lite(XiaomiFanP33):
+    """Representation of a Mi Smart Standing Fan 2 Lite (xiaomi.fan.2lite)."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._percentage = None
+        self._preset_modes = list(FAN_PRESET_MODES_2LITE)
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+
+        self._preset_mode = None
+        self._oscillate = None
+        self._natural_mode = False
+
+    @property
+    def supported_features(self) -> int:
+        """Return supported features."""
+        return (
+            FanEntityFeature.OSCILLATE
+            | FanEntityFeature.PRESET_MODE
+            | FanEntityFeature.SET_SPEED
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.TURN_ON
+        )
+
+    @property
+    def speed_count(self) -> int:
+        """Return the number of speeds the fan supports."""
+        return FAN_2LITE_SPEED_COUNT
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._oscillate = state.horizontal_swing
+            self._natural_mode = state.mode == OperationModeFan2Lite.Natural.name
+            self._state = state.power
+            self._preset_mode = FAN_PRESET_MODE_SLEEP if self._natural_mode else None
+
+            if state.fan_level is None:
+                self._percentage = None
+            else:
+                self._percentage = ranged_value_to_percentage(
+                    (1, FAN_2LITE_SPEED_COUNT), state.fan_level + 1
+                )
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                    if hasattr(state, value)
+                }
+            )
+            self._retry = 0
+
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    async def async_set_percentage(self, percentage: int) -> None:
+        """Set the speed percentage of the fan."""
+        _LOGGER.debug("Setting the fan percentage to: %s", percentage)
+
+        if percentage == 0:
+            await self.async_turn_off()
+            return
+
+        level = (
+            math.ceil(
+                percentage_to_ranged_value((1, FAN_2LITE_SPEED_COUNT), percentage)
+            )
+            - 1
+        )
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+        if self._natural_mode:
+            await self._try_command(
+                "Setting fan mode of the miio device failed.",
+                self._device.set_mode,
+                OperationModeFan2Lite.Straight,
+            )
+        await self._try_command(
+            "Setting fan level of the miio device failed.",
+            self._device.set_fan_level,
+            level,
+        )
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set the preset mode of the fan."""
+        _LOGGER.debug("Setting the preset mode to: %s", preset_mode)
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+
+        mode = (
+            OperationModeFan2Lite.Natural
+            if preset_mode == FAN_PRESET_MODE_SLEEP
+            else OperationModeFan2Lite.Straight
+        )
+        await self._try_command(
+            "Setting fan mode of the miio device failed.",
+            self._device.set_mode,
+            mode,
+        )
+
+    async def async_set_natural_mode_on(self):
+        """Turn the natural mode on."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFan2Lite.Natural,
+        )
+
+    async def async_set_natural_mode_off(self):
+        """Turn the natural mode off."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFan2Lite.Straight,
+        )
+
+
+OperationModeFanP85 = OperationModeFanP70
+
+
+# urn:miot-spec-v2:device:fan:0000A005:xiaomi-p85:1:0000D062
+MIOT_SPEC_FAN_P85 = MiotFanSpec(
+    name="P85",
+    model=MODEL_FAN_P85,
+    modes=OperationModeFanP85,
+    properties={
+        "power": (2, 1),
+        "fault": (2, 2),
+        "mode": (2, 3),
+        "fan_level": (2, 4),
+        "horizontal_swing": (2, 6),
+        "horizontal_swing_angle": (2, 7),
+        "led": (5, 1),
+        "buzzer": (7, 1),
+        "child_lock": (8, 1),
+        "delay": (9, 1),
+        "delay_time": (9, 2),
+        "delay_remain_time": (9, 4),
+        "fan_speed": (11, 6),
+    },
+    actions={"toggle": (2, 3), "turn_left": (2, 6), "turn_right": (2, 7)},
+    angles=(30, 60, 90),
+)
+
+
+class XiaomiFanP85(XiaomiFanP33):
+    """Representation of a Xiaomi Fan P85 (Xiaomi Smart Standing Fan Pro Slim)."""
+
+    def __init__(
+        self,
+        name,
+        device,
+        model,
+        unique_id,
+        retries,
+        preset_modes_override,
+        status_cache_ttl,
+        attribute_filters,
+    ):
+        """Initialize the fan entity."""
+        super().__init__(
+            name,
+            device,
+            model,
+            unique_id,
+            retries,
+            preset_modes_override,
+            status_cache_ttl,
+            attribute_filters,
+        )
+
+        self._percentage = None
+        self._preset_modes = list(FAN_PRESET_MODES_P85)
+        if preset_modes_override is not None:
+            self._preset_modes = preset_modes_override
+
+        self._preset_mode = None
+        self._oscillate = None
+        self._natural_mode = False
+
+    @property
+    def supported_features(self) -> int:
+        """Return supported features."""
+        return (
+            FanEntityFeature.OSCILLATE
+            | FanEntityFeature.PRESET_MODE
+            | FanEntityFeature.SET_SPEED
+            | FanEntityFeature.TURN_OFF
+            | FanEntityFeature.TURN_ON
+        )
+
+    async def async_update(self):
+        """Fetch state from the device."""
+        if self._skip_update:
+            self._skip_update = False
+            return
+
+        try:
+            state = await self._async_status()
+            _LOGGER.debug("Got new state: %s", state)
+
+            if not self._update_status_fingerprint(state):
+                self._retry = 0
+                return
+
+            self._available = True
+            self._percentage = state.fan_speed
+            self._oscillate = state.horizontal_swing
+            self._natural_mode = state.mode == OperationModeFanP85.Natural.name
+            self._state = state.power
+
+            for preset_mode, value in FAN_PRESET_MODES_P85.items():
+                if preset_mode == SPEED_OFF:
+                    continue
+                is_natural = preset_mode.startswith("Natural")
+                if state.fan_level == value and is_natural == self._natural_mode:
+                    self._preset_mode = preset_mode
+                    break
+
+            self._state_attrs.update(
+                {
+                    key: self._extract_value_from_attribute(state, value)
+                    for key, value in self._available_attributes.items()
+                    if hasattr(state, value)
+                }
+            )
+            self._retry = 0
+
+        except DeviceException as ex:
+            self._retry = self._retry + 1
+            if self._retry < self._retries:
+                _LOGGER.info(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+            else:
+                self._available = False
+                _LOGGER.error(
+                    "%s Got exception while fetching the state: %s , _retry=%s",
+                    self.__class__.__name__,
+                    ex,
+                    self._retry,
+                )
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set the preset mode of the fan."""
+        _LOGGER.debug("Setting the preset mode to: %s", preset_mode)
+
+        if preset_mode == SPEED_OFF:
+            await self.async_turn_off()
+            return
+
+        if not self._state:
+            await self._try_command(
+                "Turning the miio device on failed.", self._device.on
+            )
+
+        natural = preset_mode.startswith("Natural")
+        await self._try_command(
+            "Setting fan mode failed.",
+            self._device.set_mode,
+            OperationModeFanP85.Natural if natural else OperationModeFanP85.Straight,
+        )
+        await self._try_command(
+            "Setting fan level of the miio device failed.",
+            self._device.set_fan_level,
+            FAN_PRESET_MODES_P85[preset_mode],
+        )
+
+    async def async_set_natural_mode_on(self):
+        """Turn the natural mode on."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanP85.Natural,
+        )
+
+    async def async_set_natural_mode_off(self):
+        """Turn the natural mode off."""
+        if self._device_features & FEATURE_SET_NATURAL_MODE == 0:
+            return
+        await self._try_command(
+            "Setting fan natural mode of the miio device failed.",
+            self._device.set_mode,
+            OperationModeFanP85.Straight,
+        )
+
+    async def async_set_delay_off(self, delay_off_countdown: int) -> None:
+        """Set delay off countdown."""
+        await self._try_command(
+            "Setting delay off miio device failed.",
+            self._device.delay_off,
+            delay_off_countdown,
+        )
+
+    async def async_set_led_brightness(self, brightness: int = 2):
+        """Set LED on (brightness != 2) or off (brightness == 2)."""
+        if self._device_features & FEATURE_SET_LED == 0:
+            return
+        await self._try_command(
+            "Setting LED of the miio device failed.",
+            self._device.set_light,
+            brightness != 2,
+        )
+
+    async def async_turn(
+        self, direction: str, steps: int = 1, angle: float | None = None
+    ):
+        """Turn fan in the given direction by a number of steps or an angle."""
+        if self._device_features & FEATURE_TURN == 0:
+            return
+        if angle is not None:
+            steps = max(round(angle / TURN_STEP_ANGLE), 1)
+        await self._try_command(
+            "Turning the miio device failed.",
+            self._device.turn,
+            direction,
+            steps,
+        )
+
+
+FAN_MODELS.update(
+    {
+        **{
+            model: FanModel(
+                Fan,
+                XiaomiFan,
+                FEATURE_FLAGS_FAN,
+                AVAILABLE_ATTRIBUTES_FAN,
+                delay_off_unit=1,
+            )
+            for model in [
+                MODEL_FAN_V2,
+                MODEL_FAN_V3,
+                MODEL_FAN_SA1,
+                MODEL_FAN_ZA1,
+                MODEL_FAN_ZA3,
+                MODEL_FAN_ZA4,
+            ]
+        },
+        MODEL_FAN_ZA5: FanModel(
+            FanZA5,
+            XiaomiFanZA5,
+            FEATURE_FLAGS_FAN_ZA5,
+            AVAILABLE_ATTRIBUTES_FAN_ZA5,
+            delay_off_unit=1,
+        ),
+        MODEL_FAN_P5: FanModel(
+            FanP5, XiaomiFanP5, FEATURE_FLAGS_FAN_P5, AVAILABLE_ATTRIBUTES_FAN_P5
+        ),
+        MODEL_FAN_P8: FanModel(
+            _Fan1C, XiaomiFan1C, FEATURE_FLAGS_FAN_1C, AVAILABLE_ATTRIBUTES_FAN_1C
+        ),
+        MODEL_FAN_P9: FanModel(
+            _FanMiot, XiaomiFanMiot, FEATURE_FLAGS_FAN_P5, AVAILABLE_ATTRIBUTES_FAN_P5
+        ),
+        **{
+            model: FanModel(
+                _FanMiot,
+                XiaomiFanMiot,
+                FEATURE_FLAGS_FAN_P5,
+                AVAILABLE_ATTRIBUTES_FAN_P5,
+                mapping_model=MODEL_FAN_P10,
+            )
+            for model in [MODEL_FAN_P10, MODEL_FAN_P18, MODEL_FAN_P30]
+        },
+        **{
+            model: FanModel(
+                _FanMiot,
+                XiaomiFanMiot,
+                FEATURE_FLAGS_FAN_P5,
+                AVAILABLE_ATTRIBUTES_FAN_P5,
+                mapping_model=MODEL_FAN_P11,
+            )
+            for model in [MODEL_FAN_P11, MODEL_FAN_P15]
+        },
+        MODEL_FAN_XIAOMI_P30: FanModel(
+            MIOT_SPEC_FAN_XIAOMI_P30,
+            XiaomiFanXiaomiP30,
+            FEATURE_FLAGS_FAN_XIAOMI_P30,
+            AVAILABLE_ATTRIBUTES_FAN_XIAOMI_P30,
+            delay_off_unit=1,
+            delay_off_remaining="delay_remain_time",
+            delay_off_switch="delay",
+        ),
+        MODEL_FAN_P33: FanModel(
+            FanP33, XiaomiFanP33, FEATURE_FLAGS_FAN_P33, AVAILABLE_ATTRIBUTES_FAN_P33
+        ),
+        MODEL_FAN_P39: FanModel(
+            FanP39, XiaomiFanP39, FEATURE_FLAGS_FAN_P39, AVAILABLE_ATTRIBUTES_FAN_P39
+        ),
+        MODEL_FAN_P45: FanModel(
+            MIOT_SPEC_FAN_P45,
+            XiaomiFanP45,
+            FEATURE_FLAGS_FAN_P45,
+            AVAILABLE_ATTRIBUTES_FAN_P45,
+            delay_off_unit=1,
+            delay_off_remaining="delay_remain_time",
+            delay_off_switch="delay",
+        ),
+        MODEL_FAN_P76: FanModel(
+            MIOT_SPEC_FAN_P76,
+            XiaomiFanP76,
+            FEATURE_FLAGS_FAN_P76,
+            AVAILABLE_ATTRIBUTES_FAN_P76,
+            delay_off_unit=1,
+            delay_off_remaining="delay_remain_time",
+            delay_off_switch="delay",
+        ),
+        MODEL_FAN_P70: FanModel(
+            MIOT_SPEC_FAN_P70,
+            XiaomiFanP70,
+            FEATURE_FLAGS_FAN_P70,
+            AVAILABLE_ATTRIBUTES_FAN_P70,
+            delay_off_deadline=False,
+        ),
+        MODEL_FAN_P85: FanModel(
+            MIOT_SPEC_FAN_P85,
+            XiaomiFanP85,
+            FEATURE_FLAGS_FAN_P85,
+            AVAILABLE_ATTRIBUTES_FAN_P85,
+            delay_off_unit=1,
+            delay_off_remaining="delay_remain_time",
+            delay_off_switch="delay",
+        ),
+        MODEL_FAN_2LITE: FanModel(
+            MIOT_SPEC_FAN_2LITE,
+            XiaomiFan2Lite,
+            FEATURE_FLAGS_FAN_2LITE,
+            AVAILABLE_ATTRIBUTES_FAN_2LITE,
+            delay_off_deadline=False,
+        ),
+        MODEL_FAN_LESHOW_SS4: FanModel(
+            FanLeshow,
+            XiaomiFanLeshow,
+            FEATURE_FLAGS_FAN_LESHOW_SS4,
+            AVAILABLE_ATTRIBUTES_FAN_LESHOW_SS4,
+        ),
+        MODEL_FAN_1C: FanModel(
+            _Fan1C, XiaomiFan1C, FEATURE_FLAGS_FAN_1C, AVAILABLE_ATTRIBUTES_FAN_1C
+        ),
+    }
+)
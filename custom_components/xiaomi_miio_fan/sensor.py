@@ -0,0 +1,248 @@
+"""Sensors of the Xiaomi Mi Smart Pedestal Fan platform.
+
+The sensors are set up by the fan platform. With ``diagnostic_sensors``
+enabled, they read the request statistics of the fan after each poll. With
+``environment_sensors`` enabled, the temperature and the humidity of the
+models measuring them are read from the status of the poll. No sensor sends
+any request to the device.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    CONF_HOST,
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import (
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_ENVIRONMENT_SENSORS,
+    DATA_KEY,
+    SIGNAL_POLLED,
+)
+from .stats import RequestStats
+
+if TYPE_CHECKING:
+    from .miio_fan import XiaomiGenericDevice
+
+
+@dataclass(frozen=True, kw_only=True)
+class XiaomiFanSensorEntityDescription(SensorEntityDescription):
+    """Description of a diagnostic sensor of a fan."""
+
+    value_fn: Callable[[RequestStats], float | None]
+
+
+SENSOR_TYPES = (
+    XiaomiFanSensorEntityDescription(
+        key="last_poll_latency",
+        name="Last poll latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda stats: stats.last_poll_latency,
+    ),
+    XiaomiFanSensorEntityDescription(
+        key="poll_latency_p95",
+        name="Poll latency p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda stats: stats.poll_latency_p95,
+    ),
+    XiaomiFanSensorEntityDescription(
+        key="poll_success_ratio",
+        name="Poll success ratio",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda stats: (
+            stats.poll_success_ratio * 100
+            if stats.poll_success_ratio is not None
+            else None
+        ),
+    ),
+    XiaomiFanSensorEntityDescription(
+        key="poll_interval",
+        name="Poll interval",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda stats: stats.poll_interval,
+    ),
+)
+
+
+# Minimum time between two states of an environment sensor, in seconds
+ENVIRONMENT_SENSOR_INTERVAL = 60
+
+
+@dataclass(frozen=True, kw_only=True)
+class XiaomiFanEnvironmentSensorEntityDescription(SensorEntityDescription):
+    """Description of an environment sensor of a fan."""
+
+    # Attribute of the status of the fan
+    attribute: str
+
+
+ENVIRONMENT_SENSOR_TYPES = (
+    XiaomiFanEnvironmentSensorEntityDescription(
+        key="temperature",
+        name="Temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        attribute="temperature",
+    ),
+    XiaomiFanEnvironmentSensorEntityDescription(
+        key="humidity",
+        name="Humidity",
+        device_class=SensorDeviceClass.HUMIDITY,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        attribute="humidity",
+    ),
+)
+
+
+# pylint: disable=unused-argument
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Set up the sensors of a fan discovered by the fan platform."""
+    if discovery_info is None:
+        return
+
+    host = discovery_info[CONF_HOST]
+    fan = hass.data[DATA_KEY][host]
+    entities: list[SensorEntity] = []
+    if discovery_info[CONF_DIAGNOSTIC_SENSORS]:
+        entities.extend(
+            XiaomiFanDiagnosticSensor(fan, host, description)
+            for description in SENSOR_TYPES
+        )
+    if discovery_info[CONF_ENVIRONMENT_SENSORS]:
+        entities.extend(
+            XiaomiFanEnvironmentSensor(fan, host, description)
+            for description in ENVIRONMENT_SENSOR_TYPES
+        )
+    async_add_entities(entities)
+
+
+class XiaomiFanDiagnosticSensor(SensorEntity):
+    """Representation of a diagnostic sensor of a fan."""
+
+    entity_description: XiaomiFanSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        fan: "XiaomiGenericDevice",
+        host: str,
+        description: XiaomiFanSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._fan = fan
+        self._host = host
+        self._attr_name = f"{fan.name} {description.name}"
+        if fan.unique_id is not None:
+            self._attr_unique_id = f"{fan.unique_id}-{description.key}"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self._fan.request_stats)
+
+    async def async_added_to_hass(self) -> None:
+        """Update the sensor after each poll of the fan."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_POLLED.format(self._host), self._async_polled
+            )
+        )
+
+    @callback
+    def _async_polled(self) -> None:
+        """Write the state after a poll."""
+        self.async_write_ha_state()
+
+
+class XiaomiFanEnvironmentSensor(SensorEntity):
+    """Representation of the temperature or the humidity measured by a fan.
+
+    The readings come with the polls of the fan, but a new state is written
+    at most once per ``ENVIRONMENT_SENSOR_INTERVAL``, so the recorder keeps
+    a compact history for the long-term statistics.
+    """
+
+    entity_description: XiaomiFanEnvironmentSensorEntityDescription
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        fan: "XiaomiGenericDevice",
+        host: str,
+        description: XiaomiFanEnvironmentSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._fan = fan
+        self._host = host
+        self._written_at: float | None = None
+        self._written_available: bool | None = None
+        self._attr_name = f"{fan.name} {description.name}"
+        if fan.unique_id is not None:
+            self._attr_unique_id = f"{fan.unique_id}-{description.key}"
+
+    @property
+    def available(self) -> bool:
+        """Return true if the fan reported a status."""
+        return self._fan.available and self._fan.last_status is not None
+
+    @property
+    def native_value(self) -> Any:
+        """Return the reading of the last status of the fan."""
+        return getattr(self._fan.last_status, self.entity_description.attribute, None)
+
+    async def async_added_to_hass(self) -> None:
+        """Update the sensor after the polls of the fan."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_POLLED.format(self._host), self._async_polled
+            )
+        )
+
+    @callback
+    def _async_polled(self) -> None:
+        """Write the state if the last one is old or the availability changed."""
+        now = time.monotonic()
+        if (
+            self._written_at is not None
+            and now - self._written_at < ENVIRONMENT_SENSOR_INTERVAL
+            and self.available == self._written_available
+        ):
+            return
+        self._written_at = now
+        self._written_available = self.available
+        self.async_write_ha_state()
@@ -0,0 +1,165 @@
+"""Request statistics of the Xiaomi Mi Smart Pedestal Fan platform."""
+
+from collections import Counter, deque
+from dataclasses import dataclass, field
+import math
+import time
+from typing import Any
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, math.inf)
+# Number of requests kept with their latency
+RECENT_REQUESTS = 100
+# Error code of the requests without response
+ERROR_TIMEOUT = "timeout"
+# Operation of the status polls
+POLL_OPERATION = "status"
+
+
+@dataclass(slots=True)
+class OperationStats:
+    """Latency histogram and error counters of one operation."""
+
+    count: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    total_ms: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+
+    def record(self, latency_ms: float, error: bool, timeout: bool) -> None:
+        """Record a request."""
+        self.count += 1
+        self.errors += error
+        self.timeouts += timeout
+        self.total_ms += latency_ms
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if latency_ms <= bound:
+                self.buckets[index] += 1
+                break
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "timeout_rate": self.timeouts / self.count if self.count else None,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "histogram_ms": {
+                str(bound): count
+                for bound, count in zip(LATENCY_BUCKETS, self.buckets, strict=True)
+            },
+        }
+
+
+class RequestStats:
+    """Latency and error statistics of the requests to a device."""
+
+    def __init__(self, model: str) -> None:
+        """Initialize."""
+        self.model = model
+        self.operations: dict[str, OperationStats] = {}
+        # (operation, monotonic time, latency in ms, error code) of the most
+        # recent requests
+        self.recent: deque[tuple[str, float, float, str | None]] = deque(
+            maxlen=RECENT_REQUESTS
+        )
+        self.error_codes: Counter[str] = Counter()
+        # Number of properties requested per status poll
+        self.batch_sizes: Counter[int] = Counter()
+        # Number of failed polls retried by the next poll
+        self.retries = 0
+        # Monotonic time of the last handshake with the device
+        self.last_handshake: float | None = None
+
+    def record(
+        self,
+        operation: str,
+        latency_ms: float,
+        *,
+        error_code: str | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        """Record a request, failed with the given error code if any."""
+        if operation not in self.operations:
+            self.operations[operation] = OperationStats()
+        self.operations[operation].record(
+            latency_ms, error_code is not None, error_code == ERROR_TIMEOUT
+        )
+        self.recent.append((operation, time.monotonic(), latency_ms, error_code))
+        if error_code is not None:
+            self.error_codes[error_code] += 1
+        if batch_size is not None:
+            self.batch_sizes[batch_size] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "model": self.model,
+            "retries": self.retries,
+            "error_codes": dict(self.error_codes),
+            "batch_sizes": dict(self.batch_sizes),
+            "operations": {
+                operation: stats.as_dict()
+                for operation, stats in self.operations.items()
+            },
+            "recent": [
+                {"operation": operation, "latency_ms": latency_ms, "error": error_code}
+                for operation, _, latency_ms, error_code in self.recent
+            ],
+        }
+
+    def _recent_polls(self) -> list[tuple[float, float, str | None]]:
+        """Return the time, latency and error code of the recent polls."""
+        return [
+            (at, latency_ms, error_code)
+            for operation, at, latency_ms, error_code in self.recent
+            if operation == POLL_OPERATION
+        ]
+
+    @property
+    def last_poll_latency(self) -> float | None:
+        """Return the latency of the last poll in milliseconds."""
+        polls = self._recent_polls()
+        return polls[-1][1] if polls else None
+
+    @property
+    def poll_latency_p95(self) -> float | None:
+        """Return the 95th percentile latency of the recent polls."""
+        latencies = sorted(latency_ms for _, latency_ms, _ in self._recent_polls())
+        if not latencies:
+            return None
+        return latencies[math.ceil(len(latencies) * 0.95) - 1]
+
+    @property
+    def poll_success_ratio(self) -> float | None:
+        """Return the share of the recent polls which succeeded."""
+        polls = self._recent_polls()
+        if not polls:
+            return None
+        return sum(error_code is None for _, _, error_code in polls) / len(polls)
+
+    @property
+    def poll_interval(self) -> float | None:
+        """Return the mean interval between the recent polls in seconds."""
+        polls = self._recent_polls()
+        if len(polls) < 2:
+            return None
+        return (polls[-1][0] - polls[0][0]) / (len(polls) - 1)
+
+
+def error_code(ex: BaseException) -> str:
+    """Return the error code of a failed request.
+
+    Requests without response are reported as ``timeout``, errors of the
+    device by their miIO error code and other failures by exception type.
+    """
+    cause: BaseException | None = ex
+    while cause is not None:
+        if isinstance(cause, OSError):
+            return ERROR_TIMEOUT
+        code = getattr(cause, "code", None)
+        if code is not None:
+            return str(code)
+        cause = cause.__cause__
+    return type(ex).__name__
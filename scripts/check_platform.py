@@ -0,0 +1,114 @@
+"""Checks of the fan platform which have no place in Home Assistant itself.
+
+- The configuration schema of ``fan.py`` validates the models against
+  ``MODELS`` of ``const.py``, so the schema works without python-miio. The
+  check fails if it lists other models than the model registry
+  ``FAN_MODELS`` of ``miio_fan.py``.
+- The modules Home Assistant imports on startup, the fan platform and the
+  diagnostics module, must be importable without python-miio, and their
+  imports must stay within a time budget. Home Assistant and voluptuous are
+  imported first, so only the modules of this repository are timed.
+
+::
+
+    python -m scripts.check_platform --budget 0.05
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+from custom_components.xiaomi_miio_fan.const import MODELS
+from custom_components.xiaomi_miio_fan.miio_fan import FAN_MODELS
+
+# Import time budget of each module, in seconds
+DEFAULT_BUDGET = 0.05
+# Modules of the integration Home Assistant imports on startup
+STARTUP_MODULES = {
+    "fan platform": "custom_components.xiaomi_miio_fan.fan",
+    "diagnostics module": "custom_components.xiaomi_miio_fan.diagnostics",
+}
+IMPORT_SAMPLES = 5
+IMPORT_TIMER = """
+import importlib
+import json
+import sys
+import time
+
+import homeassistant.components.diagnostics
+import homeassistant.components.fan
+import homeassistant.helpers.config_validation
+import voluptuous
+
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+
+print(
+    json.dumps(
+        {
+            "seconds": time.perf_counter() - start,
+            "miio": any(
+                name == "miio" or name.startswith("miio.") for name in sys.modules
+            ),
+        }
+    )
+)
+"""
+
+
+def check_models() -> list[str]:
+    """Return the differences between the schema models and the registry."""
+    errors = []
+    if len(set(MODELS)) != len(MODELS):
+        errors.append("MODELS lists a model more than once")
+    if missing := sorted(FAN_MODELS.keys() - set(MODELS)):
+        errors.append(f"Missing in MODELS: {', '.join(missing)}")
+    if unknown := sorted(set(MODELS) - FAN_MODELS.keys()):
+        errors.append(f"Missing in FAN_MODELS: {', '.join(unknown)}")
+    return errors
+
+
+def check_import_time(name: str, module: str, budget: float) -> list[str]:
+    """Return the violations of the import time budget of a module."""
+    samples = []
+    for _ in range(IMPORT_SAMPLES):
+        # A new interpreter per sample, so nothing is imported yet
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_TIMER, module],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        samples.append(json.loads(output))
+
+    errors = []
+    if any(sample["miio"] for sample in samples):
+        errors.append(f"Importing the {name} imports python-miio")
+    seconds = min(sample["seconds"] for sample in samples)
+    print(f"Import of the {name}: {seconds * 1000:.1f} ms")
+    if seconds > budget:
+        errors.append(
+            f"Importing the {name} takes {seconds * 1000:.1f} ms, "
+            f"more than the budget of {budget * 1000:.0f} ms"
+        )
+    return errors
+
+
+def main() -> None:
+    """Run the checks and exit with an error if any of them fails."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET)
+    args = parser.parse_args()
+
+    errors = check_models()
+    for name, module in STARTUP_MODULES.items():
+        errors += check_import_time(name, module, args.budget)
+    for error in errors:
+        print(error)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
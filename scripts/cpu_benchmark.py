@@ -0,0 +1,183 @@
+"""CPU microbenchmarks of the status decoding and state mapping per model.
+
+The benchmarks replay the ``get_prop``/``get_properties`` responses recorded
+in ``status_payloads.json`` for every model, so they need neither a device
+nor a network. Per model they time:
+
+- ``status``: decoding the responses into the status of python-miio
+- ``attributes``: extracting the state attributes from the status
+- ``update``: the ``async_update`` of the entity, including the preset
+  resolution, for a status which changed since the previous poll
+
+and ``percentage`` times ``async_set_percentage`` of the models converting
+percentages to speed levels, without sending the commands.
+
+Like pyperf, each benchmark is calibrated to run long enough per sample and
+reports the time per call over a number of samples. The results are written
+as JSON; ``--compare`` checks them against the results of another version::
+
+    python -m scripts.cpu_benchmark --output main.json
+    python -m scripts.cpu_benchmark --compare main.json --output branch.json
+"""
+
+import argparse
+from collections.abc import Callable, Coroutine
+from importlib.metadata import version
+import itertools
+import json
+from pathlib import Path
+import platform
+import statistics
+import sys
+import time
+from typing import Any
+
+from custom_components.xiaomi_miio_fan.const import MODEL_FAN_2LITE
+from custom_components.xiaomi_miio_fan.miio_fan import FAN_MODELS
+
+PAYLOADS = Path(__file__).with_name("status_payloads.json")
+# Models whose async_set_percentage converts the percentage to a speed level
+PERCENTAGE_MODELS = (MODEL_FAN_2LITE,)
+# Minimum duration of a sample, in seconds
+MIN_SAMPLE_TIME = 0.01
+DEFAULT_SAMPLES = 20
+DEFAULT_THRESHOLD = 1.10
+
+
+def run_coroutine(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine which never suspends without an event loop."""
+    try:
+        coro.send(None)
+    except StopIteration as result:
+        return result.value
+    coro.close()
+    raise RuntimeError("The benchmarked coroutine suspended")
+
+
+def bench(func: Callable[[], Any], samples: int) -> dict[str, Any]:
+    """Time a function and return the statistics per call in seconds."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - start >= MIN_SAMPLE_TIME:
+            break
+        loops *= 2
+
+    values = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        values.append((time.perf_counter() - start) / loops)
+
+    return {
+        "loops": loops,
+        "mean": statistics.fmean(values),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "median": statistics.median(values),
+        "min": min(values),
+        "values": values,
+    }
+
+
+def model_benchmarks(model: str, responses: list[Any]) -> dict[str, Callable[[], Any]]:
+    """Return the benchmarks of a model."""
+    fan_model = FAN_MODELS[model]
+    device = fan_model.device_class(
+        "127.0.0.1", 32 * "0", model=fan_model.mapping_model or model
+    )
+    replay = itertools.cycle(responses)
+    device.send = lambda *args, **kwargs: next(replay)  # type: ignore[method-assign]
+    status = device.status()
+
+    entity = fan_model.entity_class(model, device, model, None, 1, None, 0, {})
+
+    async def async_status():
+        return status
+
+    async def async_try_command(mask_error, func, *args, **kwargs):
+        return True
+
+    entity._async_status = async_status  # type: ignore[method-assign]
+    entity._try_command = async_try_command  # type: ignore[method-assign]
+
+    def update() -> None:
+        entity._status_fingerprint = None
+        run_coroutine(entity.async_update())
+
+    benchmarks: dict[str, Callable[[], Any]] = {
+        "status": device.status,
+        "attributes": lambda: {
+            key: entity._extract_value_from_attribute(status, value)
+            for key, value in entity._available_attributes.items()
+        },
+        "update": update,
+    }
+    if model in PERCENTAGE_MODELS:
+        update()
+
+        def set_percentages() -> None:
+            for percentage in range(1, 101):
+                run_coroutine(entity.async_set_percentage(percentage))
+
+        benchmarks["percentage"] = set_percentages
+    return benchmarks
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float):
+    """Print the ratios of the medians and return the regressed benchmarks."""
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            continue
+        ratio = result["median"] / baseline["benchmarks"][name]["median"]
+        print(f"{name}: {ratio:.2f}x")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--model", action="append", help="benchmark only a model")
+    parser.add_argument("--output", default="cpu_benchmark.json")
+    parser.add_argument("--compare", help="results of the baseline version")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="ratio of the medians above which a benchmark regressed",
+    )
+    args = parser.parse_args()
+
+    payloads = json.loads(PAYLOADS.read_text())
+    results: dict[str, Any] = {
+        "metadata": {
+            "python": platform.python_version(),
+            "python-miio": version("python-miio"),
+            "platform": platform.platform(),
+        },
+        "benchmarks": {},
+    }
+    for model in args.model or FAN_MODELS:
+        for name, func in model_benchmarks(model, payloads[model]).items():
+            result = bench(func, args.samples)
+            results["benchmarks"][f"{model}/{name}"] = result
+            print(f"{model}/{name}: {result['median'] * 1e6:.1f} us")
+
+    Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressed: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
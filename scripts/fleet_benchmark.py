@@ -0,0 +1,344 @@
+"""Fleet benchmark of the fan platform against simulated fans.
+
+For each fleet size a Home Assistant instance sets up the fan platform of
+this repository for N fans served by ``scripts.miio_simulator`` in a child
+process, so the benchmark needs neither hardware nor a network::
+
+    python -m scripts.fleet_benchmark --fans 10 100 --output benchmark.json
+
+Measured per fleet size:
+
+- the time until the first poll of every fan is done
+- the wall time of a poll cycle refreshing all fans at once
+- the peak number of threads during the poll cycles
+- the lag of the event loop during the poll cycles
+- the CPU time per poll
+- the memory allocated per fan entity, including its first poll
+- the latency of the ``fan.set_percentage`` and ``fan.set_preset_mode``
+  service calls, from the call until the state is written
+
+The results are written as JSON, so two versions can be compared.
+"""
+
+import argparse
+import asyncio
+from contextlib import asynccontextmanager, suppress
+import json
+import logging
+import math
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.bootstrap import async_load_base_functionality
+from homeassistant.components.fan import (
+    ATTR_PERCENTAGE,
+    ATTR_PRESET_MODE,
+    SERVICE_SET_PERCENTAGE,
+    SERVICE_SET_PRESET_MODE,
+)
+from homeassistant.config_entries import ConfigEntries
+from homeassistant.const import ATTR_ENTITY_ID, Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.loader import async_setup as async_setup_loader
+from homeassistant.setup import async_setup_component
+
+# The fans are imported up front to keep the modules out of the memory per fan
+from custom_components.xiaomi_miio_fan import miio_fan  # noqa: F401
+from custom_components.xiaomi_miio_fan.const import DATA_KEY, DOMAIN
+
+from .miio_simulator import TEST_TOKEN, hosts
+
+REPOSITORY = Path(__file__).resolve().parent.parent
+DEFAULT_FLEET_SIZES = (10, 100, 500, 1000)
+# Interval of the scheduled polls, long enough to keep them out of the cycles
+SCAN_INTERVAL = 3600
+LOOP_LAG_INTERVAL = 0.01
+THREAD_SAMPLE_INTERVAL = 0.005
+SERVICE_CALL_SAMPLES = 20
+STATE_CHANGE_TIMEOUT = 10
+FIRST_POLL_TIMEOUT = 600
+
+
+def summarize(values: list[float]) -> dict[str, float | None]:
+    """Return the mean, median, 95th percentile and maximum of the values."""
+    if not values:
+        return {"mean": None, "p50": None, "p95": None, "max": None}
+    ordered = sorted(values)
+    return {
+        "mean": statistics.fmean(ordered),
+        "p50": ordered[math.ceil(len(ordered) * 0.5) - 1],
+        "p95": ordered[math.ceil(len(ordered) * 0.95) - 1],
+        "max": ordered[-1],
+    }
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs a periodic callback."""
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        self.lags: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _async_run(self) -> None:
+        """Sleep in a loop and record the oversleep."""
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(LOOP_LAG_INTERVAL)
+            self.lags.append((loop.time() - start - LOOP_LAG_INTERVAL) * 1000)
+
+    def start(self) -> None:
+        """Start measuring."""
+        self.lags.clear()
+        self._task = asyncio.get_running_loop().create_task(self._async_run())
+
+    def stop(self) -> None:
+        """Stop measuring."""
+        if self._task is not None:
+            self._task.cancel()
+
+
+class ThreadMonitor:
+    """Sample the number of threads of the process."""
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        """Sample until stopped."""
+        while not self._stop.wait(THREAD_SAMPLE_INTERVAL):
+            self.peak = max(self.peak, threading.active_count())
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+
+
+@asynccontextmanager
+async def simulated_fans(args: argparse.Namespace, count: int):
+    """Run the simulator of the fans in a child process."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "scripts.miio_simulator",
+        "--model",
+        args.model,
+        "--count",
+        str(count),
+        "--latency",
+        str(args.latency),
+        "--jitter",
+        str(args.jitter),
+        "--loss",
+        str(args.loss),
+        "--cpu-delay",
+        str(args.cpu_delay),
+        "--set",
+        "power=true",
+        "--set",
+        "fan_level=1",
+        cwd=REPOSITORY,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    try:
+        assert process.stdout is not None
+        await process.stdout.readline()
+        yield
+    finally:
+        process.terminate()
+        await process.wait()
+
+
+async def async_start_home_assistant(config_dir: str) -> HomeAssistant:
+    """Return a running Home Assistant instance loading this repository."""
+    hass = HomeAssistant(config_dir)
+    async_setup_loader(hass)
+    hass.config.skip_pip = True
+    hass.config_entries = ConfigEntries(hass, {})
+    await async_load_base_functionality(hass)
+    await hass.async_start()
+    return hass
+
+
+async def async_wait_first_polls(entities: list[Any]) -> None:
+    """Wait until every fan has been polled once."""
+    deadline = time.monotonic() + FIRST_POLL_TIMEOUT
+    while not all(entity._polled for entity in entities):
+        if time.monotonic() > deadline:
+            raise TimeoutError("The first polls didn't finish")
+        await asyncio.sleep(0.05)
+
+
+async def async_time_service_calls(
+    hass: HomeAssistant, entities: list[Any], service: str, data: dict[str, Any]
+) -> list[float]:
+    """Return the latency of service calls to a sample of the fans in ms.
+
+    A call is done once the state of the fan changed, which happens after
+    the refresh following the command.
+    """
+    latencies = []
+    for entity in entities[:SERVICE_CALL_SAMPLES]:
+        state_changed = asyncio.Event()
+        unsubscribe = async_track_state_change_event(
+            hass,
+            [entity.entity_id],
+            lambda event, state_changed=state_changed: state_changed.set(),
+        )
+        start = time.perf_counter()
+        try:
+            await hass.services.async_call(
+                Platform.FAN,
+                service,
+                {ATTR_ENTITY_ID: entity.entity_id, **data},
+                blocking=True,
+            )
+            await asyncio.wait_for(state_changed.wait(), STATE_CHANGE_TIMEOUT)
+        except TimeoutError:
+            continue
+        finally:
+            unsubscribe()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def async_benchmark_fleet(args: argparse.Namespace, count: int) -> dict:
+    """Benchmark a fleet of the given size."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        Path(config_dir, "custom_components").symlink_to(
+            REPOSITORY / "custom_components"
+        )
+        hass = await async_start_home_assistant(config_dir)
+        async with simulated_fans(args, count):
+            tracemalloc.start()
+            start = time.perf_counter()
+            await async_setup_component(
+                hass,
+                Platform.FAN,
+                {
+                    Platform.FAN: [
+                        {
+                            "platform": DOMAIN,
+                            "host": host,
+                            "token": TEST_TOKEN,
+                            "name": f"Fan {index}",
+                            "model": args.model,
+                            "scan_interval": SCAN_INTERVAL,
+                            # Every poll of a cycle must reach the simulator
+                            "status_cache_ttl": 0,
+                        }
+                        for index, host in enumerate(hosts(count))
+                    ],
+                    DOMAIN: {"max_concurrent_requests": args.max_concurrent_requests},
+                },
+            )
+            await hass.async_block_till_done()
+            entities = list(hass.data[DATA_KEY].values())
+            await async_wait_first_polls(entities)
+            first_poll_time = time.perf_counter() - start
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            loop_lag = LoopLagMonitor()
+            threads = ThreadMonitor()
+            loop_lag.start()
+            threads.start()
+            cycle_times = []
+            cpu_start = time.process_time()
+            for _ in range(args.cycles):
+                start = time.perf_counter()
+                await asyncio.gather(
+                    *(entity.async_update_ha_state(True) for entity in entities)
+                )
+                cycle_times.append(time.perf_counter() - start)
+            cpu_time = time.process_time() - cpu_start
+            loop_lag.stop()
+            threads.stop()
+
+            percentage_latencies = await async_time_service_calls(
+                hass, entities, SERVICE_SET_PERCENTAGE, {ATTR_PERCENTAGE: 50}
+            )
+            preset_latencies = await async_time_service_calls(
+                hass,
+                entities,
+                SERVICE_SET_PRESET_MODE,
+                {ATTR_PRESET_MODE: entities[0].preset_modes[-1]},
+            )
+            failed = sum(not entity.available for entity in entities)
+
+        await hass.async_stop(force=True)
+
+    return {
+        "fans": count,
+        "unavailable_fans": failed,
+        "first_poll_s": first_poll_time,
+        "poll_cycle_s": summarize(cycle_times),
+        "peak_threads": threads.peak,
+        "loop_lag_ms": summarize(loop_lag.lags),
+        "cpu_per_poll_ms": cpu_time / (args.cycles * count) * 1000,
+        "memory_per_fan_bytes": memory / count,
+        "set_percentage_ms": summarize(percentage_latencies),
+        "set_preset_mode_ms": summarize(preset_latencies),
+    }
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Benchmark all fleet sizes and write the results."""
+    results = {
+        "model": args.model,
+        "conditions": {
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "loss": args.loss,
+            "cpu_delay": args.cpu_delay,
+        },
+        "max_concurrent_requests": args.max_concurrent_requests,
+        "cycles": args.cycles,
+        "fleets": [],
+    }
+    for count in args.fans:
+        fleet = await async_benchmark_fleet(args, count)
+        print(json.dumps(fleet))
+        results["fleets"].append(fleet)
+
+    Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="dmaker.fan.p33")
+    parser.add_argument(
+        "--fans", type=int, nargs="+", default=list(DEFAULT_FLEET_SIZES)
+    )
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--max-concurrent-requests", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--cpu-delay", type=float, default=0.001)
+    parser.add_argument("--output", default="benchmark.json")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    with suppress(KeyboardInterrupt):
+        asyncio.run(async_main(args))
+
+
+if __name__ == "__main__":
+    main()
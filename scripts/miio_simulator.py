@@ -0,0 +1,288 @@
+"""Simulator of MIoT fans speaking the miIO protocol.
+
+Each simulated fan answers the miIO handshake and the encrypted
+``get_properties``, ``set_properties``, ``action`` and ``miIO.info``
+requests for the property mapping of its model, so the integration can be
+exercised without hardware::
+
+    python -m scripts.miio_simulator --model dmaker.fan.p33 --count 10 --latency 0.02
+
+python-miio always talks to the miIO port, so every fan listens on its own
+loopback address: 127.0.0.2, 127.0.0.3 and so on. Linux routes the whole
+127.0.0.0/8 network to the loopback interface, other systems need aliases.
+Only the MIoT models are simulated; the miIO fans speak ``get_prop``.
+
+The network conditions are applied per request: the response is delayed by
+the latency plus a uniform jitter and requests are dropped with the given
+probability. A fan processes one request at a time and holds it for the CPU
+delay, like the single-threaded firmware of the real devices.
+"""
+
+import argparse
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
+from ipaddress import IPv4Address
+import json
+import logging
+import random
+import struct
+from typing import Any, cast
+
+from miio.protocol import Message
+
+_LOGGER = logging.getLogger(__name__)
+
+MIIO_PORT = 54321
+TEST_TOKEN = "00112233445566778899aabbccddeeff"
+FIRST_HOST = "127.0.0.2"
+HELLO_LENGTH = 32
+
+ERROR_UNKNOWN_METHOD = {"code": -32601, "message": "Method not found."}
+# Codes of the MIoT property and action results
+CODE_OK = 0
+CODE_UNKNOWN_PROPERTY = -4003
+
+
+@dataclass
+class NetworkConditions:
+    """Delays and losses applied to the requests of a simulated fan."""
+
+    # Delay of each response, in seconds
+    latency: float = 0.0
+    # Upper bound of the random delay added to the latency, in seconds
+    jitter: float = 0.0
+    # Probability of a request getting lost
+    loss: float = 0.0
+    # Time the fan spends on a request, in seconds
+    cpu_delay: float = 0.0
+
+
+class SimulatedFan(asyncio.DatagramProtocol):
+    """A MIoT fan answering miIO requests for a property mapping."""
+
+    def __init__(
+        self,
+        model: str,
+        mapping: dict[str, dict[str, Any]],
+        conditions: NetworkConditions,
+        *,
+        token: str = TEST_TOKEN,
+        device_id: int = 1,
+        initial: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the fan with all properties zero unless given."""
+        self.model = model
+        self.conditions = conditions
+        self.requests = 0
+        self.dropped = 0
+        self._token = bytes.fromhex(token)
+        self._device_id = device_id
+        self._transport: asyncio.DatagramTransport | None = None
+        self._busy = asyncio.Lock()
+        self._names = {
+            (prop["siid"], prop["piid"]): name
+            for name, prop in mapping.items()
+            if "piid" in prop
+        }
+        self.properties: dict[str, Any] = {name: 0 for name in self._names.values()}
+        self.properties.update(initial or {})
+        self.actions: list[tuple[int, int, list[Any]]] = []
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Remember the transport of the fan."""
+        self._transport = cast(asyncio.DatagramTransport, transport)
+
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        """Handle a request in the background."""
+        asyncio.get_running_loop().create_task(self._async_handle(data, addr))
+
+    async def _async_handle(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        """Answer a request unless it gets lost."""
+        self.requests += 1
+        if random.random() < self.conditions.loss:
+            self.dropped += 1
+            return
+
+        if len(data) == HELLO_LENGTH:
+            response = self._hello()
+        else:
+            try:
+                request = Message.parse(data, token=self._token).data.value
+            except Exception:
+                _LOGGER.debug("Dropping undecodable request from %s", addr)
+                return
+            async with self._busy:
+                await asyncio.sleep(self.conditions.cpu_delay)
+                response = self._build(self._dispatch(request))
+
+        await asyncio.sleep(
+            self.conditions.latency + random.uniform(0, self.conditions.jitter)
+        )
+        if self._transport is not None:
+            self._transport.sendto(response, addr)
+
+    def _hello(self) -> bytes:
+        """Return the response to a handshake."""
+        return struct.pack(
+            ">HHIII16s",
+            0x2131,
+            HELLO_LENGTH,
+            0,
+            self._device_id,
+            int(datetime.now(UTC).timestamp()),
+            b"\xff" * 16,
+        )
+
+    def _build(self, payload: dict[str, Any]) -> bytes:
+        """Return an encrypted response."""
+        header = {
+            "length": 0,
+            "unknown": 0,
+            "device_id": self._device_id.to_bytes(4, "big"),
+            "ts": datetime.now(UTC).replace(tzinfo=None),
+        }
+        return Message.build(
+            {"data": {"value": payload}, "header": {"value": header}, "checksum": 0},
+            token=self._token,
+        )
+
+    def _dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Execute a request and return the response payload."""
+        method = request.get("method")
+        params: Any = request.get("params")
+        if method == "get_properties":
+            result: Any = [self._get_property(prop) for prop in params]
+        elif method == "set_properties":
+            result = [self._set_property(prop) for prop in params]
+        elif method == "action":
+            self.actions.append((params["siid"], params["aiid"], params.get("in", [])))
+            result = {"code": CODE_OK}
+        elif method == "miIO.info":
+            result = {
+                "model": self.model,
+                "mac": ":".join(
+                    f"{byte:02X}" for byte in self._device_id.to_bytes(6, "big")
+                ),
+                "fw_ver": "1.0.0_simulated",
+                "hw_ver": "simulator",
+            }
+        else:
+            return {"id": request.get("id"), "error": ERROR_UNKNOWN_METHOD}
+
+        return {"id": request.get("id"), "result": result}
+
+    def _get_property(self, prop: dict[str, Any]) -> dict[str, Any]:
+        """Return the result of reading a property."""
+        name = self._names.get((prop["siid"], prop["piid"]))
+        if name is None:
+            return {**prop, "code": CODE_UNKNOWN_PROPERTY}
+        return {**prop, "code": CODE_OK, "value": self.properties[name]}
+
+    def _set_property(self, prop: dict[str, Any]) -> dict[str, Any]:
+        """Return the result of writing a property."""
+        name = self._names.get((prop["siid"], prop["piid"]))
+        result: dict[str, Any] = {
+            key: prop[key] for key in ("did", "siid", "piid") if key in prop
+        }
+        if name is None:
+            return {**result, "code": CODE_UNKNOWN_PROPERTY}
+        self.properties[name] = prop["value"]
+        return {**result, "code": CODE_OK}
+
+
+def hosts(count: int, first_host: str = FIRST_HOST) -> list[str]:
+    """Return the loopback addresses of the given number of fans."""
+    first = IPv4Address(first_host)
+    return [str(first + index) for index in range(count)]
+
+
+async def async_start_fans(
+    model: str,
+    mapping: dict[str, dict[str, Any]],
+    count: int,
+    conditions: NetworkConditions,
+    *,
+    token: str = TEST_TOKEN,
+    first_host: str = FIRST_HOST,
+    initial: dict[str, Any] | None = None,
+) -> dict[str, tuple[SimulatedFan, asyncio.DatagramTransport]]:
+    """Start simulated fans of a model and return them by host."""
+    loop = asyncio.get_running_loop()
+    fans = {}
+    for index, host in enumerate(hosts(count, first_host), start=1):
+        transport, fan = await loop.create_datagram_endpoint(
+            partial(
+                SimulatedFan,
+                model,
+                mapping,
+                conditions,
+                token=token,
+                device_id=index,
+                initial=initial,
+            ),
+            local_addr=(host, MIIO_PORT),
+        )
+        fans[host] = (fan, transport)
+    return fans
+
+
+def model_mapping(model: str) -> dict[str, dict[str, Any]]:
+    """Return the MIoT property mapping of a model of the integration."""
+    from custom_components.xiaomi_miio_fan.miio_fan import FAN_MODELS  # noqa: PLC0415
+
+    fan_model = FAN_MODELS[model]
+    device = fan_model.device_class(
+        FIRST_HOST, TEST_TOKEN, model=fan_model.mapping_model or model
+    )
+    return device._get_mapping()
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run the simulated fans until interrupted."""
+    conditions = NetworkConditions(args.latency, args.jitter, args.loss, args.cpu_delay)
+    initial = {
+        name: json.loads(value)
+        for name, value in (setting.split("=", 1) for setting in args.set)
+    }
+    fans = await async_start_fans(
+        args.model, model_mapping(args.model), args.count, conditions, initial=initial
+    )
+    print(
+        f"Simulating {args.count} {args.model} on {FIRST_HOST}.."
+        f"{hosts(args.count)[-1]} with token {TEST_TOKEN}"
+    )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for _, transport in fans.values():
+            transport.close()
+
+
+def main() -> None:
+    """Parse the arguments and run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", required=True)
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--cpu-delay", type=float, default=0.0)
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="PROPERTY=JSON",
+        help="initial value of a property, e.g. power=true",
+    )
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(async_main(args))
+
+
+if __name__ == "__main__":
+    main()